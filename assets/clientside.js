@@ -0,0 +1,171 @@
+/*clientside.js*/
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    // Statistics panel (homepage)
+    stats: {
+        update: function (payload) {
+            const noUpdate = window.dash_clientside.no_update;
+
+            // Status message instead of statistics
+            if (!payload || payload.message) {
+                return [
+                    payload ? payload.message : "No data loaded",
+                    payload ? payload.color : "secondary",
+                    true,
+                    { display: "none" },
+                    noUpdate,
+                    noUpdate,
+                    noUpdate,
+                    noUpdate,
+                    noUpdate,
+                    noUpdate,
+                    noUpdate,
+                    noUpdate,
+                    noUpdate,
+                ];
+            }
+
+            const fixed = (value, digits) =>
+                value === null || value === undefined ? "nan" : value.toFixed(digits);
+            const range = (r) => `[${fixed(r[0], 2)}, ${fixed(r[1], 2)}]`;
+
+            return [
+                noUpdate,
+                noUpdate,
+                false,
+                { display: "block" },
+                payload.name,
+                fixed(payload.mean, 3),
+                fixed(payload.min, 3),
+                fixed(payload.max, 3),
+                fixed(payload.std, 3),
+                payload.n.toLocaleString("en-US"),
+                range(payload.xr),
+                range(payload.yr),
+                range(payload.zr),
+            ];
+        },
+    },
+
+    // Case selection controls (performance tracking)
+    cases: {
+        select_clear_all: function (selectClicks, clearClicks, options) {
+            const triggered = window.dash_clientside.callback_context.triggered.map(
+                (t) => t.prop_id
+            );
+
+            if (triggered.includes("select-all-btn.n_clicks") && options) {
+                return options.map((opt) => opt.value);
+            }
+            return [];
+        },
+
+        clear_dates: function (nClicks) {
+            if (nClicks) {
+                return [null, null];
+            }
+            const noUpdate = window.dash_clientside.no_update;
+            return [noUpdate, noUpdate];
+        },
+    },
+
+    // Tracking graphs built in the browser (performance tracking)
+    tracking: {
+        parameter_3d: function (filtered, store, xParam, yParam, zParam) {
+            if (!filtered || !store) {
+                return window.dash_clientside.no_update;
+            }
+
+            const layout = { template: store.template };
+            const axes = [xParam, yParam, zParam];
+            if (!axes.every((param) => param in store.columns)) {
+                return { data: [], layout: layout };
+            }
+
+            // One pass: filtered cases with values for all three axes, and
+            // the subset that also has a colour value
+            const ids = new Set(filtered.ids);
+            const color = store.color;
+            const valid = (v) => v !== null && v !== undefined;
+            let rows = [];
+            const colored = [];
+            store.ids.forEach((id, i) => {
+                if (
+                    ids.has(id) &&
+                    axes.every((param) => valid(store.columns[param][i]))
+                ) {
+                    rows.push(i);
+                    if (color && valid(color.values[i])) {
+                        colored.push(i);
+                    }
+                }
+            });
+
+            const data = [];
+            if (rows.length) {
+                const marker = {
+                    size: 7,
+                    line: { width: 1, color: "#ffffff" },
+                    color: "#00D9FF",
+                };
+
+                // Colour by the store's metric, dropping cases without it
+                if (colored.length) {
+                    rows = colored;
+                    marker.color = rows.map((i) => color.values[i]);
+                    marker.colorscale = color.colorscale;
+                    marker.showscale = true;
+                    marker.colorbar = {
+                        title: { text: color.title },
+                        bgcolor: "rgba(0,0,0,0.5)",
+                        bordercolor: "#444444",
+                        borderwidth: 1,
+                        tickfont: { color: "#ffffff" },
+                    };
+                }
+
+                const pick = (param) => rows.map((i) => store.columns[param][i]);
+                data.push({
+                    type: "scatter3d",
+                    x: pick(xParam),
+                    y: pick(yParam),
+                    z: pick(zParam),
+                    mode: "markers+text",
+                    marker: marker,
+                    text: rows.map((i) => store.names[i]),
+                    textposition: "top center",
+                    textfont: { size: 10, color: "#ffffff" },
+                    hovertemplate:
+                        "<b>%{text}</b><br>" +
+                        `${store.titles[xParam]}: %{x:.2f}<br>` +
+                        `${store.titles[yParam]}: %{y:.2f}<br>` +
+                        `${store.titles[zParam]}: %{z:.2f}<br>` +
+                        "<extra></extra>",
+                });
+            }
+
+            const axis = (param) => ({
+                title: { text: store.labels[param] },
+                backgroundcolor: "rgba(0,0,0,0)",
+                gridcolor: "#444444",
+                showbackground: true,
+                zerolinecolor: "#444444",
+            });
+
+            layout.scene = {
+                xaxis: axis(xParam),
+                yaxis: axis(yParam),
+                zaxis: axis(zParam),
+                camera: { eye: { x: 2.0, y: 2.0, z: 2.0 } },
+                bgcolor: "rgba(0,0,0,0)",
+            };
+            layout.plot_bgcolor = "rgba(0,0,0,0)";
+            layout.paper_bgcolor = "rgba(0,0,0,0)";
+            layout.font = { color: "#ffffff" };
+            layout.margin = { l: 0, r: 0, t: 0, b: 0 };
+            layout.autosize = true;
+
+            return { data: data, layout: layout };
+        },
+    },
+});
@@ -1,6 +1,12 @@
+import os
 import sqlite3
+import threading
+import warnings
+import numpy as np
 import pandas as pd
+from collections import OrderedDict
 from datetime import datetime
+from functools import cached_property, wraps
 import json
 
 # Database configuration
@@ -629,3 +635,140 @@ class CFDDatabase:
             conn.close()
             print(f"Error deleting case: {e}")
             return False
+
+
+class CaseArrays:
+    """Struct-of-arrays snapshot of get_all_cases(), one NumPy array per column"""
+
+    def __init__(self, df, numeric_cols):
+        self.df = df
+        self.ids = df["id"].to_numpy()
+        self.names = df["case_name"].to_numpy(dtype=object)
+        # Integer code per case name, so selections compare ints, not strings
+        self.name_codes, uniques = pd.factorize(self.names)
+        self.name_index = pd.Index(uniques)
+        self.status = df["status"].to_numpy(dtype=object)
+        self.timestamps = df["timestamp"].to_numpy(dtype=object)
+        self.ts = pd.to_datetime(
+            df["timestamp"], format="mixed", errors="coerce"
+        ).to_numpy(dtype="datetime64[ns]")
+        self.arrays = {col: df[col].to_numpy(dtype=float) for col in numeric_cols}
+        self.completed = self.status == "completed"
+
+        # Completed rows in chronological order
+        rows = np.flatnonzero(self.completed)
+        self.completed_rows = rows[np.argsort(self.ts[rows], kind="stable")]
+
+        # Full date range as plain YYYY-MM-DD strings (None when empty)
+        self.date_range = (
+            (str(df["timestamp"].min())[:10], str(df["timestamp"].max())[:10])
+            if len(df)
+            else (None, None)
+        )
+
+    def __len__(self):
+        return len(self.ids)
+
+    @cached_property
+    def completed_range(self):
+        """Per-column (min, max) over completed cases; NaN for columns without data"""
+        ranges = {}
+        # All-NaN columns are expected (e.g. metrics never filled in)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            for col, values in self.arrays.items():
+                values = values[self.completed]
+                ranges[col] = (
+                    (np.nanmin(values), np.nanmax(values))
+                    if len(values)
+                    else (np.nan, np.nan)
+                )
+        return ranges
+
+    def name_mask(self, names):
+        """Boolean mask of the rows whose case name is in names"""
+        codes = self.name_index.get_indexer(list(names))
+        return np.isin(self.name_codes, codes[codes >= 0])
+
+    def mask(
+        self, selected_cases=None, start_date=None, end_date=None, required_cols=()
+    ):
+        """Boolean mask of completed cases matching selection, dates and columns"""
+        mask = self.completed.copy()
+
+        if selected_cases:
+            mask &= self.name_mask(selected_cases)
+
+        # In-place bounds: no combined temporary for the date range. The end
+        # date is inclusive, so it covers the whole day, not just its midnight
+        if start_date and end_date:
+            mask &= self.ts >= np.datetime64(start_date)
+            mask &= self.ts < np.datetime64(end_date) + np.timedelta64(1, "D")
+
+        for col in required_cols:
+            mask &= ~np.isnan(self.arrays[col])
+
+        return mask
+
+
+class CaseCache:
+    """In-process CaseArrays cache, reloaded when the database file changes"""
+
+    # Results kept per snapshot by memoize(), least recently used dropped first
+    MEMO_SIZE = 128
+
+    def __init__(self, db):
+        self.db = db
+        self._lock = threading.Lock()
+        self._snapshot = None
+        self._version = None
+        self._memo = OrderedDict()
+
+    def _db_version(self):
+        """Modification stamp of the database file (shared by all workers)"""
+        try:
+            stat = os.stat(self.db.db_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def get(self):
+        """Get the current snapshot, reloading it from SQLite only if stale"""
+        version = self._db_version()
+        with self._lock:
+            if self._snapshot is None or version != self._version:
+                numeric_cols = self.db.design_params + self.db.performance_metrics
+                self._snapshot = CaseArrays(self.db.get_all_cases(), numeric_cols)
+                self._version = version
+                self._memo.clear()
+            return self._snapshot
+
+    def invalidate(self):
+        """Drop the snapshot (and its memoized results) so the next get() reloads it"""
+        with self._lock:
+            self._snapshot = None
+            self._memo.clear()
+
+    def memoize(self, func):
+        """Cache func(snapshot, *args) results until the snapshot is reloaded"""
+
+        @wraps(func)
+        def wrapper(data, *args):
+            key = (func, *args)
+            with self._lock:
+                # Results for an outdated snapshot are computed but never kept
+                current = data is self._snapshot
+                if current and key in self._memo:
+                    self._memo.move_to_end(key)
+                    return self._memo[key]
+
+            result = func(data, *args)
+
+            with self._lock:
+                if current and data is self._snapshot:
+                    self._memo[key] = result
+                    if len(self._memo) > self.MEMO_SIZE:
+                        self._memo.popitem(last=False)
+            return result
+
+        return wrapper
@@ -5,11 +5,12 @@ import os
 import pickle
 from pathlib import Path
 
+import bottleneck as bn
 import dash_bootstrap_components as dbc
 import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
-from dash import Input, Output, State, callback_context, dcc, html
+from dash import ClientsideFunction, Input, Output, State, callback_context, dcc, html
 
 # Data processing
 from scipy.interpolate import griddata
@@ -36,6 +37,8 @@ class DataStore:
 
         self.metadata = {}
 
+        self.pretty = {}  # Display names keyed by column
+
         self.alreadyProcessed = True  # Flag to check if data is already processed
 
         self.number_of_slices_per_plane = number_of_slices_per_plane # Number of slices per plane
@@ -57,6 +60,8 @@ class DataStore:
             try:
                 self.df = pd.read_csv(self.default_csv_path)
 
+                self._build_pretty_names()
+
                 print(f"Default CSV loaded: {self.default_csv_path}")
 
                 self.preprocess_data()
@@ -70,6 +75,7 @@ class DataStore:
         """Set a new DataFrame and trigger preprocessing"""
 
         self.df = df
+        self._build_pretty_names()
         self.alreadyProcessed = False   # Reset processed flag
         self.preprocess_data()
 
@@ -78,6 +84,19 @@ class DataStore:
 
         return self.df
 
+    def get_pretty_name(self, col):
+        """Return the display name for a column"""
+
+        if col not in self.pretty:
+            self.pretty[col] = col.replace("_", " ").title()
+
+        return self.pretty[col]
+
+    def _build_pretty_names(self):
+        """Precompute display names for all columns"""
+
+        self.pretty = {c: c.replace("_", " ").title() for c in self.df.columns}
+
     def get_metadata(self):
         """Return metadata about the data"""
 
@@ -1167,11 +1186,209 @@ layout = dbc.Container(
                                             children=[
                                                 dbc.Alert(
                                                     "No data loaded",
+                                                    id="stats-message",
                                                     color="secondary",
                                                     className="text-center",
-                                                )
+                                                ),
+                                                # Static skeleton, filled in client-side
+                                                html.Div(
+                                                    id="stats-panel",
+                                                    style={"display": "none"},
+                                                    children=[
+                                                        dbc.Row(
+                                                            [
+                                                                dbc.Col(
+                                                                    [
+                                                                        dbc.Card(
+                                                                            [
+                                                                                dbc.CardBody(
+                                                                                    [
+                                                                                        html.H6(
+                                                                                            id="stats-variable",
+                                                                                            className="text-warning mb-1",
+                                                                                        ),
+                                                                                        html.H4(
+                                                                                            id="stats-mean",
+                                                                                            className="text-white mb-0",
+                                                                                        ),
+                                                                                        html.Small(
+                                                                                            "Average",
+                                                                                            className="text-muted",
+                                                                                        ),
+                                                                                    ]
+                                                                                )
+                                                                            ],
+                                                                            className="bg-secondary text-center",
+                                                                        )
+                                                                    ],
+                                                                    width=12,
+                                                                    className="mb-2",
+                                                                )
+                                                            ]
+                                                        ),
+                                                        dbc.Row(
+                                                            [
+                                                                dbc.Col(
+                                                                    [
+                                                                        dbc.Card(
+                                                                            [
+                                                                                dbc.CardBody(
+                                                                                    [
+                                                                                        html.Small(
+                                                                                            "Min",
+                                                                                            className="text-muted",
+                                                                                        ),
+                                                                                        html.H5(
+                                                                                            id="stats-min",
+                                                                                            className="text-info mb-0",
+                                                                                        ),
+                                                                                    ],
+                                                                                    className="p-2",
+                                                                                )
+                                                                            ],
+                                                                            className="bg-dark",
+                                                                        )
+                                                                    ],
+                                                                    width=6,
+                                                                ),
+                                                                dbc.Col(
+                                                                    [
+                                                                        dbc.Card(
+                                                                            [
+                                                                                dbc.CardBody(
+                                                                                    [
+                                                                                        html.Small(
+                                                                                            "Max",
+                                                                                            className="text-muted",
+                                                                                        ),
+                                                                                        html.H5(
+                                                                                            id="stats-max",
+                                                                                            className="text-danger mb-0",
+                                                                                        ),
+                                                                                    ],
+                                                                                    className="p-2",
+                                                                                )
+                                                                            ],
+                                                                            className="bg-dark",
+                                                                        )
+                                                                    ],
+                                                                    width=6,
+                                                                ),
+                                                            ],
+                                                            className="mb-2",
+                                                        ),
+                                                        dbc.Row(
+                                                            [
+                                                                dbc.Col(
+                                                                    [
+                                                                        dbc.Card(
+                                                                            [
+                                                                                dbc.CardBody(
+                                                                                    [
+                                                                                        html.Small(
+                                                                                            "Std Dev",
+                                                                                            className="text-muted",
+                                                                                        ),
+                                                                                        html.H5(
+                                                                                            id="stats-std",
+                                                                                            className="text-warning mb-0",
+                                                                                        ),
+                                                                                    ],
+                                                                                    className="p-2",
+                                                                                )
+                                                                            ],
+                                                                            className="bg-dark",
+                                                                        )
+                                                                    ],
+                                                                    width=6,
+                                                                ),
+                                                                dbc.Col(
+                                                                    [
+                                                                        dbc.Card(
+                                                                            [
+                                                                                dbc.CardBody(
+                                                                                    [
+                                                                                        html.Small(
+                                                                                            "Points",
+                                                                                            className="text-muted",
+                                                                                        ),
+                                                                                        html.H5(
+                                                                                            id="stats-points",
+                                                                                            className="text-success mb-0",
+                                                                                        ),
+                                                                                    ],
+                                                                                    className="p-2",
+                                                                                )
+                                                                            ],
+                                                                            className="bg-dark",
+                                                                        )
+                                                                    ],
+                                                                    width=6,
+                                                                ),
+                                                            ],
+                                                            className="mb-3",
+                                                        ),
+                                                        html.Hr(className="my-3"),
+                                                        dbc.Card(
+                                                            [
+                                                                dbc.CardBody(
+                                                                    [
+                                                                        html.H6(
+                                                                            "Selected Region",
+                                                                            className="text-info mb-2",
+                                                                        ),
+                                                                        dbc.ListGroup(
+                                                                            [
+                                                                                dbc.ListGroupItem(
+                                                                                    [
+                                                                                        html.Strong(
+                                                                                            "X: ",
+                                                                                            className="text-warning",
+                                                                                        ),
+                                                                                        html.Span(
+                                                                                            id="stats-x-range"
+                                                                                        ),
+                                                                                    ],
+                                                                                    className="bg-dark border-secondary py-1",
+                                                                                ),
+                                                                                dbc.ListGroupItem(
+                                                                                    [
+                                                                                        html.Strong(
+                                                                                            "Y: ",
+                                                                                            className="text-warning",
+                                                                                        ),
+                                                                                        html.Span(
+                                                                                            id="stats-y-range"
+                                                                                        ),
+                                                                                    ],
+                                                                                    className="bg-dark border-secondary py-1",
+                                                                                ),
+                                                                                dbc.ListGroupItem(
+                                                                                    [
+                                                                                        html.Strong(
+                                                                                            "Z: ",
+                                                                                            className="text-warning",
+                                                                                        ),
+                                                                                        html.Span(
+                                                                                            id="stats-z-range"
+                                                                                        ),
+                                                                                    ],
+                                                                                    className="bg-dark border-secondary py-1",
+                                                                                ),
+                                                                            ],
+                                                                            flush=True,
+                                                                        ),
+                                                                    ],
+                                                                    className="p-2",
+                                                                )
+                                                            ],
+                                                            className="bg-secondary",
+                                                        ),
+                                                    ],
+                                                ),
                                             ],
-                                        )
+                                        ),
+                                        dcc.Store(id="stats-payload"),
                                     ]
                                 ),
                             ],
@@ -1376,7 +1593,7 @@ def register_callbacks(app):
         # Create options for dropdown
 
         options = [
-            {"label": col.replace("_", " ").title(), "value": col} for col in variables
+            {"label": dataStore.get_pretty_name(col), "value": col} for col in variables
         ]
 
         # Return first match if found, otherwise first element
@@ -1600,6 +1817,10 @@ def register_callbacks(app):
                 & (df["z"] <= z_range[1])
             ]
 
+            pretty_var = dataStore.get_pretty_name(
+                primary_var or metadata["variables"][0]
+            )
+
             fig = go.Figure()
 
             # Create mesh3d trace
@@ -1614,18 +1835,14 @@ def register_callbacks(app):
                     else df_filtered[metadata["variables"][0]],
                     colorscale=color_scale,
                     colorbar=dict(
-                        title=(primary_var or metadata["variables"][0])
-                        .replace("_", " ")
-                        .title(),
+                        title=pretty_var,
                         tickfont=dict(color="#ffffff"),
                         bgcolor="rgba(0,0,0,0.5)",
                         bordercolor="#444444",
                         borderwidth=1,
                     ),
                     opacity=0.8,
-                    name=(primary_var or metadata["variables"][0])
-                    .replace("_", " ")
-                    .title(),
+                    name=pretty_var,
                 )
             )
 
@@ -1659,7 +1876,7 @@ def register_callbacks(app):
                     bgcolor="rgba(0,0,0,0)",
                 ),
                 title=dict(
-                    text=f"3D View - {(primary_var or metadata['variables'][0]).replace('_', ' ').title()}",
+                    text=f"3D View - {pretty_var}",
                     font=dict(size=18, color="#00D9FF"),
                 ),
                 **layout_theme,
@@ -1833,6 +2050,8 @@ def register_callbacks(app):
 
             # Create contour plot
 
+            pretty_var = dataStore.get_pretty_name(primary_var)
+
             fig = go.Figure()
 
             fig.add_trace(
@@ -1853,13 +2072,13 @@ def register_callbacks(app):
                         smoothing=1.0,
                     ),
                     colorbar=dict(
-                        title=primary_var.replace("_", " ").title(),
+                        title=pretty_var,
                         tickfont=dict(color="#ffffff"),
                         bgcolor="rgba(0,0,0,0.5)",
                         bordercolor="#444444",
                         borderwidth=1,
                     ),
-                    name=primary_var.replace("_", " ").title(),
+                    name=pretty_var,
                     hovertemplate=f"{x_label}: %{{x:.3f}}<br>{y_label}: %{{y:.3f}}<br>{primary_var}: %{{z:.3f}}<extra></extra>",
                 )
             )
@@ -1868,7 +2087,7 @@ def register_callbacks(app):
                 xaxis_title=x_label,
                 yaxis_title=y_label,
                 title=dict(
-                    text=f"{title} - {primary_var.replace('_', ' ').title()}",
+                    text=f"{title} - {pretty_var}",
                     font=dict(size=18, color="#00D9FF"),
                 ),
                 **layout_theme,
@@ -2081,6 +2300,8 @@ def register_callbacks(app):
             values = values[valid_mask]
 
             if len(positions) > 0:
+                pretty_var = dataStore.get_pretty_name(primary_var)
+
                 # Determine axis labels based on metadata
 
                 if axis == "X":
@@ -2109,7 +2330,7 @@ def register_callbacks(app):
                         x=positions,
                         y=values,
                         mode="lines+markers",
-                        name=primary_var.replace("_", " ").title(),
+                        name=pretty_var,
                         line=dict(width=3, color="#00D9FF"),
                         marker=dict(
                             size=6, color="#00D9FF", line=dict(width=1, color="#ffffff")
@@ -2123,7 +2344,7 @@ def register_callbacks(app):
 
                 fig.update_layout(
                     xaxis_title=f"{axis} Position",
-                    yaxis_title=primary_var.replace("_", " ").title(),
+                    yaxis_title=pretty_var,
                     xaxis=dict(
                         range=[positions[0], positions[-1]]
                         if len(positions) > 1
@@ -2189,8 +2410,31 @@ def register_callbacks(app):
 
     # -- Statistics Display --
 
+    # The panel is rendered client-side from a small payload of numbers
+    # (see assets/clientside.js); the server only computes the statistics
+
+    app.clientside_callback(
+        ClientsideFunction(namespace="stats", function_name="update"),
+        [
+            Output("stats-message", "children"),
+            Output("stats-message", "color"),
+            Output("stats-message", "is_open"),
+            Output("stats-panel", "style"),
+            Output("stats-variable", "children"),
+            Output("stats-mean", "children"),
+            Output("stats-min", "children"),
+            Output("stats-max", "children"),
+            Output("stats-std", "children"),
+            Output("stats-points", "children"),
+            Output("stats-x-range", "children"),
+            Output("stats-y-range", "children"),
+            Output("stats-z-range", "children"),
+        ],
+        Input("stats-payload", "data"),
+    )
+
     @app.callback(
-        Output("stats-display", "children"),
+        Output("stats-payload", "data"),
         [
             Input("metadata-store", "children"),
             Input("primary-variable", "value"),
@@ -2203,16 +2447,12 @@ def register_callbacks(app):
         # Check if we have data
 
         if not metadata_json:
-            return dbc.Alert(
-                "No data loaded", color="secondary", className="text-center"
-            )
+            return {"message": "No data loaded", "color": "secondary"}
 
         metadata = json.loads(metadata_json)
 
         if not metadata or "variables" not in metadata:
-            return dbc.Alert(
-                "No preprocessed data found", color="secondary", className="text-center"
-            )
+            return {"message": "No preprocessed data found", "color": "secondary"}
 
         # Use primary variable or first available
 
@@ -2220,218 +2460,49 @@ def register_callbacks(app):
             primary_var = metadata["variables"][0] if metadata["variables"] else None
 
         if not primary_var:
-            return dbc.Alert(
-                "No valid data column found", color="warning", className="text-center"
-            )
+            return {"message": "No valid data column found", "color": "warning"}
 
         # For stats, we need to calculate from the original data
 
         df = dataStore.get_dataframe()
 
         if df is None or primary_var not in df.columns:
-            return dbc.Alert(
-                "Statistics require original data",
-                color="warning",
-                className="text-center",
-            )
+            return {"message": "Statistics require original data", "color": "warning"}
 
         # Apply range filters
 
-        df_filtered = df[
-            (df["x"] >= x_range[0])
-            & (df["x"] <= x_range[1])
-            & (df["y"] >= y_range[0])
-            & (df["y"] <= y_range[1])
-            & (df["z"] >= z_range[0])
-            & (df["z"] <= z_range[1])
-        ]
-
-        if len(df_filtered) == 0:
-            return dbc.Alert(
-                "No data points in selected range",
-                color="warning",
-                className="text-center",
-            )
+        x = df["x"].to_numpy()
 
-        # Calculate statistics on filtered data
+        y = df["y"].to_numpy()
 
-        min_val = df_filtered[primary_var].min()
+        z = df["z"].to_numpy()
 
-        max_val = df_filtered[primary_var].max()
+        mask = (
+            (x >= x_range[0])
+            & (x <= x_range[1])
+            & (y >= y_range[0])
+            & (y <= y_range[1])
+            & (z >= z_range[0])
+            & (z <= z_range[1])
+        )
 
-        mean_val = df_filtered[primary_var].mean()
+        num_points = int(np.count_nonzero(mask))
 
-        std_val = df_filtered[primary_var].std()
+        if num_points == 0:
+            return {"message": "No data points in selected range", "color": "warning"}
 
-        stats = [
-            dbc.Row(
-                [
-                    dbc.Col(
-                        [
-                            dbc.Card(
-                                [
-                                    dbc.CardBody(
-                                        [
-                                            html.H6(
-                                                primary_var.replace("_", " ").title(),
-                                                className="text-warning mb-1",
-                                            ),
-                                            html.H4(
-                                                f"{mean_val:.3f}",
-                                                className="text-white mb-0",
-                                            ),
-                                            html.Small(
-                                                "Average", className="text-muted"
-                                            ),
-                                        ]
-                                    )
-                                ],
-                                className="bg-secondary text-center",
-                            )
-                        ],
-                        width=12,
-                        className="mb-2",
-                    )
-                ]
-            ),
-            dbc.Row(
-                [
-                    dbc.Col(
-                        [
-                            dbc.Card(
-                                [
-                                    dbc.CardBody(
-                                        [
-                                            html.Small("Min", className="text-muted"),
-                                            html.H5(
-                                                f"{min_val:.3f}",
-                                                className="text-info mb-0",
-                                            ),
-                                        ],
-                                        className="p-2",
-                                    )
-                                ],
-                                className="bg-dark",
-                            )
-                        ],
-                        width=6,
-                    ),
-                    dbc.Col(
-                        [
-                            dbc.Card(
-                                [
-                                    dbc.CardBody(
-                                        [
-                                            html.Small("Max", className="text-muted"),
-                                            html.H5(
-                                                f"{max_val:.3f}",
-                                                className="text-danger mb-0",
-                                            ),
-                                        ],
-                                        className="p-2",
-                                    )
-                                ],
-                                className="bg-dark",
-                            )
-                        ],
-                        width=6,
-                    ),
-                ],
-                className="mb-2",
-            ),
-            dbc.Row(
-                [
-                    dbc.Col(
-                        [
-                            dbc.Card(
-                                [
-                                    dbc.CardBody(
-                                        [
-                                            html.Small(
-                                                "Std Dev", className="text-muted"
-                                            ),
-                                            html.H5(
-                                                f"{std_val:.3f}",
-                                                className="text-warning mb-0",
-                                            ),
-                                        ],
-                                        className="p-2",
-                                    )
-                                ],
-                                className="bg-dark",
-                            )
-                        ],
-                        width=6,
-                    ),
-                    dbc.Col(
-                        [
-                            dbc.Card(
-                                [
-                                    dbc.CardBody(
-                                        [
-                                            html.Small(
-                                                "Points", className="text-muted"
-                                            ),
-                                            html.H5(
-                                                f"{len(df_filtered):,}",
-                                                className="text-success mb-0",
-                                            ),
-                                        ],
-                                        className="p-2",
-                                    )
-                                ],
-                                className="bg-dark",
-                            )
-                        ],
-                        width=6,
-                    ),
-                ],
-                className="mb-3",
-            ),
-            html.Hr(className="my-3"),
-            dbc.Card(
-                [
-                    dbc.CardBody(
-                        [
-                            html.H6("Selected Region", className="text-info mb-2"),
-                            dbc.ListGroup(
-                                [
-                                    dbc.ListGroupItem(
-                                        [
-                                            html.Strong(
-                                                "X: ", className="text-warning"
-                                            ),
-                                            f"[{x_range[0]:.2f}, {x_range[1]:.2f}]",
-                                        ],
-                                        className="bg-dark border-secondary py-1",
-                                    ),
-                                    dbc.ListGroupItem(
-                                        [
-                                            html.Strong(
-                                                "Y: ", className="text-warning"
-                                            ),
-                                            f"[{y_range[0]:.2f}, {y_range[1]:.2f}]",
-                                        ],
-                                        className="bg-dark border-secondary py-1",
-                                    ),
-                                    dbc.ListGroupItem(
-                                        [
-                                            html.Strong(
-                                                "Z: ", className="text-warning"
-                                            ),
-                                            f"[{z_range[0]:.2f}, {z_range[1]:.2f}]",
-                                        ],
-                                        className="bg-dark border-secondary py-1",
-                                    ),
-                                ],
-                                flush=True,
-                            ),
-                        ],
-                        className="p-2",
-                    )
-                ],
-                className="bg-secondary",
-            ),
-        ]
+        # Calculate statistics on filtered data
 
-        return stats
+        sel = df[primary_var].to_numpy(dtype=np.float64)[mask]
+
+        return {
+            "name": dataStore.get_pretty_name(primary_var),
+            "mean": float(bn.nanmean(sel)),
+            "min": float(bn.nanmin(sel)),
+            "max": float(bn.nanmax(sel)),
+            "std": float(bn.nanstd(sel, ddof=1)),
+            "n": num_points,
+            "xr": x_range,
+            "yr": y_range,
+            "zr": z_range,
+        }
@@ -1,6 +1,11 @@
+import json
+import os
+
 import dash
 from dash import Dash, html, dcc
 import dash_bootstrap_components as dbc
+import plotly.io.json
+from plotly.io.json import to_json_plotly
 
 # Import layouts and callbacks from pages
 from homepage import (
@@ -12,21 +17,43 @@ from performance import (
     register_callbacks as register_performance_callbacks,
 )
 
+# Bootswatch DARKLY theme: served locally from assets/darkly.min.css (Dash
+# includes every stylesheet under assets/ automatically, gzipped by
+# Flask-Compress) only while that copy is the release dbc pins; otherwise the
+# dbc CDN theme is used, so the theme version never changes silently
+THEME_VERSION = dbc.themes.DARKLY.split("bootswatch@")[1].split("/")[0]
+THEME_ASSET = os.path.join(os.path.dirname(__file__), "assets", "darkly.min.css")
+try:
+    with open(THEME_ASSET, encoding="utf-8") as f:
+        LOCAL_THEME = f"Bootswatch v{THEME_VERSION} " in f.read(200)
+except OSError:
+    LOCAL_THEME = False
+
 # Initialize the Dash app with Bootswatch dark theme
-# Use themes: CYBORG, DARKLY, SLATE, SOLAR, SUPERHERO, VAPOR (currently DARKLY for dark mode tech vibe)
 app = Dash(
     __name__,
-    external_stylesheets=[dbc.themes.DARKLY],
     suppress_callback_exceptions=True,
     assets_folder="assets",
+    assets_ignore="" if LOCAL_THEME else r"darkly\.min\.css",
+    external_stylesheets=[] if LOCAL_THEME else [dbc.themes.DARKLY],
+    compress=True,
 )
 
 # App configuration
 app.title = "Combustion Lab Dashboard"
 
+# Dash serialises callback payloads through plotly's JSON encoder; orjson
+# encodes numeric NumPy arrays directly. Anything it cannot encode (object
+# arrays such as case names, Patch objects) sends the whole payload through
+# plotly's slow cleaning pass, so callbacks return those as lists / plain JSON
+plotly.io.json.config.default_engine = "orjson"
+
 # Server instance for deployment
 server = app.server
 
+# Asset URLs are fingerprinted by Dash (?m=<mtime>), so browsers may cache them
+server.config["SEND_FILE_MAX_AGE_DEFAULT"] = 31536000  # 1 year
+
 # Navigation bar
 navbar = html.Div(
     [
@@ -117,6 +144,14 @@ app.layout = html.Div(
 )
 
 
+# Page layouts are static, so serialise each component tree once at startup
+# and hand Dash the plain JSON instead of re-walking the tree per navigation
+PAGE_LAYOUTS = {
+    "/": json.loads(to_json_plotly(homepage_layout)),
+    "/tracking": json.loads(to_json_plotly(performance_layout)),
+}
+
+
 # Register page callbacks
 @app.callback(
     dash.dependencies.Output("page-content", "children"),
@@ -124,9 +159,9 @@ app.layout = html.Div(
 )
 def display_page(pathname):
     if pathname == "/" or pathname is None:
-        return homepage_layout
+        return PAGE_LAYOUTS["/"]
     elif pathname == "/tracking":
-        return performance_layout
+        return PAGE_LAYOUTS["/tracking"]
     else:
         return html.Div(
             [
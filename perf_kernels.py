@@ -0,0 +1,42 @@
+import numpy as np
+
+# --- Vectorised reductions over a cases x metrics matrix ---
+
+
+def best_per_metric(values, lower_is_better):
+    """Return (row index, value) of the best case per metric column; -1 if all NaN"""
+    values = np.asarray(values, dtype=float)
+    lower_is_better = np.asarray(lower_is_better, dtype=bool)
+    n_metrics = values.shape[1]
+
+    idx = np.full(n_metrics, -1)
+    val = np.full(n_metrics, np.nan)
+    if len(values) == 0:
+        return idx, val
+
+    # Flip higher-is-better columns so a single argmin covers both directions
+    signed = np.where(lower_is_better, values, -values)
+    signed = np.where(np.isnan(signed), np.inf, signed)
+
+    has_data = ~np.isnan(values).all(axis=0)
+    cols = np.flatnonzero(has_data)
+    idx[cols] = signed[:, cols].argmin(axis=0)
+    val[cols] = values[idx[cols], cols]
+    return idx, val
+
+
+def normalize_radar(values, mins, maxs, lower_is_better):
+    """Scale metrics to [0, 1] (1 = best); 0.5 without spread, 0 for missing values"""
+    values = np.asarray(values, dtype=float)
+    mins = np.asarray(mins, dtype=float)
+    maxs = np.asarray(maxs, dtype=float)
+
+    spread = maxs - mins
+    has_spread = spread > 0
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scaled = (values - mins) / spread
+    scaled = np.where(lower_is_better, 1 - scaled, scaled)
+    scaled = np.where(has_spread, scaled, 0.5)
+
+    return np.where(np.isnan(values), 0.0, scaled)
@@ -1,893 +1,1063 @@
-import dash
-from dash import html, dcc, Input, Output, State, callback_context, no_update
+import base64
+from dash import (
+    html,
+    dcc,
+    Input,
+    Output,
+    State,
+    ClientsideFunction,
+    Patch,
+    ctx,
+    dash_table,
+    no_update,
+)
+from dash.dash_table.Format import Format, Scheme
 import dash_bootstrap_components as dbc
-import plotly.graph_objects as go
-import pandas as pd
+import plotly.io as pio
+from plotly.colors import get_colorscale
 import numpy as np
 from datetime import datetime
+from functools import cache, lru_cache
 
 
 
 # Import database utilities
-from db_utils import CFDDatabase, SCHEMA
+from db_utils import CaseCache, CFDDatabase, SCHEMA
+from perf_kernels import best_per_metric, normalize_radar
 
-# Initialize database
+# Initialize database and the in-process case arrays cache
 db = CFDDatabase()
+cases = CaseCache(db)
 
-# Helper function to create form inputs dynamically
-def create_parameter_inputs(param_type, id_prefix="new-"):
-    """Create input fields based on schema parameters"""
-    inputs = []
-    params = SCHEMA.get(param_type, {})
+# Schema keys and labels, computed once
+DESIGN_PARAMS = tuple(SCHEMA["design_parameters"])
+DESIGN_DEFAULTS = tuple(
+    info.get("default", 0) for info in SCHEMA["design_parameters"].values()
+)
+PERF_METRICS = tuple(SCHEMA["performance_metrics"])
+SCHEMA_INFO = {**SCHEMA["design_parameters"], **SCHEMA["performance_metrics"]}
+
+# Display title, unit suffix and full axis label of every schema column
+TITLE = {k: k.replace("_", " ").title() for k in SCHEMA_INFO}
+UNIT = {
+    k: f" ({info['unit']})" if info.get("unit") and info["unit"] != "-" else ""
+    for k, info in SCHEMA_INFO.items()
+}
+LABEL = {k: TITLE[k] + UNIT[k] for k in SCHEMA_INFO}
+EMISSION_METRICS = tuple(m for m in PERF_METRICS if "emission" in m.lower())
+TEMP_METRICS = tuple(m for m in PERF_METRICS if "temp" in m.lower())
+
+# Default 3D x/y/z axes: the first three design parameters (first one if fewer)
+AXIS_DEFAULTS = tuple(
+    DESIGN_PARAMS[i if len(DESIGN_PARAMS) > i else 0] for i in range(3)
+)
 
-    # Group parameters into rows of 3
-    param_items = list(params.items())
-    for i in range(0, len(param_items), 3):
-        row_items = param_items[i : i + 3]
-        row_cols = []
 
-        for param_name, param_info in row_items:
-            label = param_name.replace("_", " ").title()
-            if param_info.get("unit") and param_info["unit"] != "-":
-                label += f" ({param_info['unit']})"
+# Helper function to describe form inputs (schema is static, so cache it)
+@lru_cache(maxsize=None)
+def _parameter_input_rows(param_type):
+    """Get (param_name, label, step, default) specs, grouped into rows of 3"""
+    specs = []
+    for param_name, param_info in SCHEMA.get(param_type, {}).items():
+        step = 0.01 if param_info["type"] == "REAL" else 1
+        specs.append((param_name, LABEL[param_name], step, param_info.get("default")))
 
-            col = dbc.Col(
-                [
-                    dbc.Label(label),
-                    dbc.Input(
-                        id=f"{id_prefix}{param_name}",
-                        type="number",
-                        value=param_info.get("default"),
-                        step=0.01 if param_info["type"] == "REAL" else 1,
-                    ),
-                ],
-                width=4,
-            )
-            row_cols.append(col)
+    return tuple(tuple(specs[i : i + 3]) for i in range(0, len(specs), 3))
 
-        inputs.append(dbc.Row(row_cols, className="mb-2"))
 
-    return inputs
+# Helper function to create form inputs dynamically
+def create_parameter_inputs(param_type, id_prefix="new-"):
+    """Create input fields based on schema parameters"""
+    return [
+        dbc.Row(
+            [
+                dbc.Col(
+                    [
+                        dbc.Label(label),
+                        dbc.Input(
+                            id=f"{id_prefix}{param_name}",
+                            type="number",
+                            value=default,
+                            step=step,
+                        ),
+                    ],
+                    width=4,
+                )
+                for param_name, label, step, default in row
+            ],
+            className="mb-2",
+        )
+        for row in _parameter_input_rows(param_type)
+    ]
 
 
 # Helper function to get parameter options for dropdowns
+@lru_cache(maxsize=None)
 def get_parameter_options():
     """Get parameter options for dropdown selection"""
-    options = []
+    return [{"label": LABEL[param], "value": param} for param in DESIGN_PARAMS]
 
-    # Add design parameters
-    for param_name, param_info in SCHEMA["design_parameters"].items():
-        label = param_name.replace("_", " ").title()
-        if param_info.get("unit") and param_info["unit"] != "-":
-            label += f" ({param_info['unit']})"
-        options.append({"label": label, "value": param_name})
 
-    return options
+# Radar metrics, in priority order, and those where a lower value is better
+RADAR_PRIORITY = (
+    "nox_emissions",
+    "co_emissions",
+    "pattern_factor",
+    "combustion_efficiency",
+    "mixing_quality",
+)
+LOWER_IS_BETTER = frozenset({"nox_emissions", "co_emissions", "pattern_factor"})
+
+# Trace colours (radar, emission bars) and their translucent radar fills
+RADAR_COLORS = ("#00D9FF", "#FF6B6B", "#4ECDC4", "#FFE66D", "#A06CD5")
+RADAR_FILLS = tuple(
+    f"rgba({int(c[1:3], 16)}, {int(c[3:5], 16)}, {int(c[5:7], 16)}, 0.2)"
+    for c in RADAR_COLORS
+)
 
 
 # Helper function to get metrics for radar chart
+@lru_cache(maxsize=None)
 def get_radar_metrics():
     """Get metrics suitable for radar chart visualization"""
-    # Select key performance metrics for radar chart
-    metrics = []
-    metric_labels = []
-
-    # Prioritize certain metrics if they exist
-    priority_metrics = [
-        "nox_emissions",
-        "co_emissions",
-        "pattern_factor",
-        "combustion_efficiency",
-        "mixing_quality",
-    ]
+    # Prioritize certain metrics if they exist, then fill up to 5 from the schema
+    metrics = [m for m in RADAR_PRIORITY if m in PERF_METRICS]
+    chosen = frozenset(metrics)
+    metrics += [m for m in PERF_METRICS if m not in chosen][: max(0, 5 - len(metrics))]
 
-    for metric in priority_metrics:
-        if metric in SCHEMA["performance_metrics"]:
-            metrics.append(metric)
-            # Add directional indicator
-            if metric in ["nox_emissions", "co_emissions", "pattern_factor"]:
-                metric_labels.append(metric.replace("_", " ").title() + "↓")
-            else:
-                metric_labels.append(metric.replace("_", " ").title() + "↑")
+    # Add directional indicator to the prioritized metrics
+    arrows = {m: "↓" if m in LOWER_IS_BETTER else "↑" for m in chosen}
+    metric_labels = [TITLE[m] + arrows.get(m, "") for m in metrics]
 
-    # If we don't have enough metrics, add more
-    if len(metrics) < 5:
-        for metric_name in SCHEMA["performance_metrics"]:
-            if metric_name not in metrics and len(metrics) < 5:
-                metrics.append(metric_name)
-                metric_labels.append(metric_name.replace("_", " ").title())
+    return tuple(metrics), tuple(metric_labels)
 
-    return metrics, metric_labels
 
+# Schema-derived constants shared by the layout and callbacks
+PARAM_OPTIONS = get_parameter_options()
+Y_OPTIONS = [{"label": TITLE[k], "value": k} for k in PERF_METRICS]
+RADAR_METRICS, RADAR_LABELS = get_radar_metrics()
 
-# Layout
-layout = dbc.Container(
-    [
-        # Header
-        dbc.Row(
-            [
-                dbc.Col(
-                    [
-                        dbc.Card(
-                            [
-                                dbc.CardBody(
-                                    [
-                                        html.H1(
-                                            "Performance Tracking & Analysis",
-                                            className="text-center text-primary mb-2",
-                                        ),
-                                        html.P(
-                                            "Not ACTUAL lab data, examples for demonstration purposes only!",
-                                            className="text-center text-danger mb-0 fw-bold",
-                                            style={
-                                                "background-color": "rgba(255, 0, 0, 0.1)",
-                                                "padding": "8px",
-                                                "border-radius": "4px",
-                                                "border-left": "4px solid #dc3545",
-                                                "border-right": "4px solid #dc3545",
-                                            },
-                                        ),
-                                    ]
-                                )
-                            ],
-                            className="bg-dark border-0 shadow-lg mb-4",
-                        )
-                    ],
-                    width=12,
+# Shared dcc.Graph config; WebGL traces render at a fixed pixel ratio
+GRAPH_CONFIG = {"plotGlPixelRatio": 1}
+
+# Summary cards: (metric, lower is better, value format)
+SUMMARY_METRICS = (
+    ("nox_emissions", True, "{:.1f} ppm"),
+    ("combustion_efficiency", False, "{:.1f}%"),
+    ("temperature_max", True, "{:.1f} K"),
+)
+
+
+# Helper function to compute the summary card texts (memoized per snapshot)
+@cases.memoize
+def summary_card_values(data, start_date, end_date):
+    """Get (value, case) texts per summary metric plus the completed case count"""
+    # Completed cases within the date range, if provided
+    mask = data.mask(start_date=start_date, end_date=end_date)
+
+    metrics = [m for m in SUMMARY_METRICS if m[0] in data.arrays]
+    best = {}
+    if metrics:
+        idx, val = best_per_metric(
+            np.column_stack([data.arrays[m[0]][mask] for m in metrics]),
+            [m[1] for m in metrics],
+        )
+        case_names = data.names[mask]
+        for (metric, _, fmt), i, v in zip(metrics, idx, val):
+            if i >= 0:
+                best[metric] = (fmt.format(v), case_names[i])
+
+    texts = []
+    for metric, _, _ in SUMMARY_METRICS:
+        texts.extend(best.get(metric, ("--", "No data")))
+    return (*texts, str(mask.sum()))
+
+
+# Helper function to rank completed cases by a metric (memoized per snapshot)
+@cases.memoize
+def lowest_cases(data, metric, start_date=None, end_date=None, n=3):
+    """Get the names of the n completed cases in range with the lowest metric value"""
+    values = data.arrays[metric]
+    mask = data.mask(start_date=start_date, end_date=end_date, required_cols=[metric])
+    rows = np.flatnonzero(mask)
+    best = rows[np.argsort(values[rows], kind="stable")[:n]]
+    return tuple(data.names[best].tolist())
+
+
+# Default plotly template, resolved once and attached to every dict figure
+PLOT_TEMPLATE = pio.templates[pio.templates.default].to_plotly_json()
+
+
+# Helper function to build a figure as a plain dict
+def _figure(traces=(), layout=None):
+    """Return a figure dict (skips go.Figure validation) with the default template"""
+    return {
+        "data": list(traces),
+        "layout": {"template": PLOT_TEMPLATE, **(layout or {})},
+    }
+
+
+# plotly.js typed-array codes for the float arrays sent in figures
+TYPED_ARRAY_CODES = {"float32": "f4", "float64": "f8"}
+
+
+# Helper function to send a float array as a base64 typed-array buffer
+def _typed_array(values):
+    """Encode a float array as a plotly.js typed-array spec"""
+    values = np.ascontiguousarray(values)
+    return {
+        "dtype": TYPED_ARRAY_CODES[values.dtype.name],
+        "bdata": base64.b64encode(values).decode("ascii"),
+    }
+
+
+# Static layouts; the graphs start with these and callbacks only patch the traces
+EMISSIONS_LAYOUT = dict(
+    plot_bgcolor="rgba(0,0,0,0)",
+    paper_bgcolor="rgba(0,0,0,0)",
+    font=dict(color="#ffffff"),
+    xaxis=dict(gridcolor="#444444", title=dict(text="Case Name"), tickangle=-45),
+    yaxis=dict(gridcolor="#444444", title=dict(text="Emissions (ppm)")),
+    barmode="group",
+    hovermode="x unified",
+    uirevision="keep",
+    legend=dict(bgcolor="rgba(0,0,0,0.5)", bordercolor="#444444", borderwidth=1),
+)
+TEMPERATURE_LAYOUT = dict(
+    plot_bgcolor="rgba(0,0,0,0)",
+    paper_bgcolor="rgba(0,0,0,0)",
+    font=dict(color="#ffffff"),
+    xaxis=dict(gridcolor="#444444", title=dict(text="Case Name"), tickangle=-45),
+    yaxis=dict(gridcolor="#444444", title=dict(text="Temperature (K)")),
+    hovermode="x unified",
+    uirevision="keep",
+    legend=dict(bgcolor="rgba(0,0,0,0.5)", bordercolor="#444444", borderwidth=1),
+)
+RADAR_LAYOUT = dict(
+    # Styling shared by every case's polygon lives in the template, so the
+    # patched traces only carry their values, name and fill colour
+    template={
+        **PLOT_TEMPLATE,
+        "data": {
+            **PLOT_TEMPLATE["data"],
+            "scatterpolar": [
+                dict(
+                    PLOT_TEMPLATE["data"].get("scatterpolar", [{}])[0],
+                    fill="toself",
+                    line=dict(width=2),
+                    hovertemplate="%{theta}: %{r:.2f}<extra></extra>",
                 )
-            ]
+            ],
+        },
+        "layout": {**PLOT_TEMPLATE["layout"], "colorway": RADAR_COLORS},
+    },
+    polar=dict(
+        radialaxis=dict(
+            visible=True,
+            range=[0, 1],
+            gridcolor="#444444",
+            tickfont=dict(color="#ffffff"),
         ),
-        # Control Panel and Summary Cards
-        dbc.Row(
-            [
-                # Left Panel - Case Selection and Filters
-                dbc.Col(
-                    [
-                        dbc.Card(
-                            [
-                                dbc.CardHeader(
-                                    [
-                                        html.H5(
-                                            [
-                                                html.I(className="fas fa-filter me-2"),
-                                                "Case Selection",
-                                            ],
-                                            className="mb-0 text-info",
-                                        )
-                                    ]
-                                ),
-                                dbc.CardBody(
-                                    [
-                                        dbc.Label(
-                                            "Select Cases to Compare",
-                                            className="text-warning",
-                                        ),
-                                        dcc.Dropdown(
-                                            id="case-selector",
-                                            options=[],
-                                            value=[],
-                                            multi=True,
-                                            placeholder="Select cases... (all selected by default)",
-                                            className="mb-3 darkly-dropdown",
-                                        ),
-                                        dbc.ButtonGroup(
-                                            [
-                                                dbc.Button(
-                                                    "Select All",
-                                                    id="select-all-btn",
-                                                    color="info",
-                                                    size="sm",
-                                                ),
-                                                dbc.Button(
-                                                    "Clear All",
-                                                    id="clear-all-btn",
-                                                    color="secondary",
-                                                    size="sm",
-                                                ),
-                                            ],
-                                            className="mb-3 w-100",
-                                        ),
-                                        html.Hr(),
-                                        dbc.Label(
-                                            "Time Range Filter",
-                                            className="text-warning",
-                                        ),
-                                        dbc.Row(
-                                            [
-                                                dbc.Col(
-                                                    dcc.DatePickerRange(
-                                                        id="date-range-picker",
-                                                        start_date_placeholder_text="Start Date",
-                                                        end_date_placeholder_text="End Date",
-                                                        display_format="YYYY-MM-DD",
-                                                        className="mb-3 w-100",
+        angularaxis=dict(gridcolor="#444444", tickfont=dict(color="#ffffff")),
+        bgcolor="rgba(0,0,0,0)",
+    ),
+    plot_bgcolor="rgba(0,0,0,0)",
+    paper_bgcolor="rgba(0,0,0,0)",
+    font=dict(color="#ffffff"),
+    showlegend=True,
+    legend=dict(bgcolor="rgba(0,0,0,0.5)", bordercolor="#444444", borderwidth=1),
+    uirevision="keep",
+    autosize=True,
+)
+
+
+# Helper function to update a graph's traces while keeping its layout
+def _data_patch(figure):
+    """Return a Patch (in its JSON form) replacing only the figure's data"""
+    patch = Patch()
+    patch["data"] = figure["data"]
+    # orjson cannot encode Patch objects and would fall back to the slow encoder
+    return patch.to_plotly_json()
+
+
+# Summary card templates: (title, value id, case id, value class, value, caption)
+SUMMARY_CARDS = (
+    ("Best NOx Performance", "best-nox-value", "best-nox-case", "text-success"),
+    ("Best Efficiency", "best-efficiency-value", "best-efficiency-case", "text-info"),
+    (
+        "Lowest Adiabatic Flame Temperature",
+        "best-temp-value",
+        "best-temp-case",
+        "text-info",
+    ),
+    ("Total Cases", "total-cases", None, "text-secondary", "0", "Completed"),
+)
+
+
+# Helper function to build one summary card
+def _summary_card(
+    title, value_id, case_id, value_class="text-info", value="--", caption="No data"
+):
+    """Create a summary card column; case_id=None gives a static caption"""
+    case_props = {"id": case_id} if case_id else {}
+    return dbc.Col(
+        [
+            dbc.Card(
+                [
+                    dbc.CardBody(
+                        [
+                            html.H6(title, className="text-warning"),
+                            html.H3(
+                                id=value_id,
+                                children=value,
+                                className=f"{value_class} mb-1",
+                            ),
+                            html.P(
+                                children=caption,
+                                className="text-muted mb-0 small",
+                                **case_props,
+                            ),
+                        ]
+                    )
+                ],
+                className="bg-dark text-center shadow",
+            )
+        ],
+        width=3,
+    )
+
+
+# Max points sent per timeline trace (roughly the plot width in pixels)
+TIMELINE_MAX_POINTS = 1000
+
+# Above this many points, SVG traces switch to WebGL (plotly.js' own cutoff)
+WEBGL_MIN_POINTS = 1000
+
+
+# Helper function to downsample long series for the timeline plot
+def downsample_minmax(x, y, n_out=TIMELINE_MAX_POINTS):
+    """Keep the min and max point of each bucket so peaks survive downsampling"""
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if len(y) <= n_out:
+        return x, y
+
+    # Two points (min and max) per bucket, in original order
+    edges = np.linspace(0, len(y), n_out // 2 + 1).astype(int)
+    idx = []
+    for start, stop in zip(edges[:-1], edges[1:]):
+        bucket = y[start:stop]
+        idx.extend(sorted({start + bucket.argmin(), start + bucket.argmax()}))
+
+    idx = np.asarray(idx)
+    return x[idx], y[idx]
+
+
+# Max options rendered in the case selector at once (search narrows the rest)
+CASE_OPTION_LIMIT = 200
+
+
+# Helper function to pick the case selector options for a search
+def limit_case_options(options, search_value=None, selected=None):
+    """Return the selected cases plus up to CASE_OPTION_LIMIT search matches"""
+    selected = set(selected or [])
+    search = (search_value or "").lower()
+
+    shown, n_matches = [], 0
+    for opt in options:
+        if opt["value"] in selected:
+            shown.append(opt)
+        elif n_matches < CASE_OPTION_LIMIT and search in opt["label"].lower():
+            shown.append(opt)
+            n_matches += 1
+    return shown
+
+
+# Detailed case data columns: key identifiers, then the first design
+# parameters and performance metrics
+TABLE_COLUMNS = (
+    ("case_name", "timestamp", "status") + DESIGN_PARAMS[:4] + PERF_METRICS[:4]
+)
+TABLE_PAGE_SIZE = 25
+
+# Real-valued columns are rounded for display by the table, not the callback
+TABLE_REAL_FORMAT = Format(precision=2, scheme=Scheme.fixed)
+
+
+# Helper function to create the paged case data table
+def _case_table():
+    """Case table whose rows are paged and sorted by update_data_table"""
+    return dash_table.DataTable(
+        id="case-data-table",
+        columns=[
+            (
+                {"name": col, "id": col, "type": "numeric", "format": TABLE_REAL_FORMAT}
+                if SCHEMA_INFO.get(col, {}).get("type") == "REAL"
+                else {"name": col, "id": col}
+            )
+            for col in TABLE_COLUMNS
+        ],
+        data=[],
+        page_action="custom",
+        page_current=0,
+        page_size=TABLE_PAGE_SIZE,
+        sort_action="custom",
+        sort_mode="single",
+        sort_by=[],
+        style_table={"overflowX": "auto"},
+        style_header={
+            "backgroundColor": "#303030",
+            "color": "#ffffff",
+            "fontWeight": "bold",
+            "border": "1px solid #444444",
+        },
+        style_cell={
+            "backgroundColor": "#222222",
+            "color": "#ffffff",
+            "border": "1px solid #444444",
+            "minWidth": "120px",
+            "textAlign": "left",
+        },
+        style_data_conditional=[
+            {"if": {"row_index": "odd"}, "backgroundColor": "#2b2b2b"}
+        ],
+    )
+
+
+# Layout
+@cache
+def _build_layout():
+    """Build the tracking page layout (static, so built once per process)"""
+    return dbc.Container(
+        [
+            # Header
+            dbc.Row(
+                [
+                    dbc.Col(
+                        [
+                            dbc.Card(
+                                [
+                                    dbc.CardBody(
+                                        [
+                                            html.H1(
+                                                "Performance Tracking & Analysis",
+                                                className="text-center text-primary mb-2",
+                                            ),
+                                            html.P(
+                                                "Not ACTUAL lab data, examples for demonstration purposes only!",
+                                                className="text-center text-danger mb-0 fw-bold",
+                                                style={
+                                                    "background-color": "rgba(255, 0, 0, 0.1)",
+                                                    "padding": "8px",
+                                                    "border-radius": "4px",
+                                                    "border-left": "4px solid #dc3545",
+                                                    "border-right": "4px solid #dc3545",
+                                                },
+                                            ),
+                                        ]
+                                    )
+                                ],
+                                className="bg-dark border-0 shadow-lg mb-4",
+                            )
+                        ],
+                        width=12,
+                    )
+                ]
+            ),
+            # Control Panel and Summary Cards
+            dbc.Row(
+                [
+                    # Left Panel - Case Selection and Filters
+                    dbc.Col(
+                        [
+                            dbc.Card(
+                                [
+                                    dbc.CardHeader(
+                                        [
+                                            html.H5(
+                                                [
+                                                    html.I(className="fas fa-filter me-2"),
+                                                    "Case Selection",
+                                                ],
+                                                className="mb-0 text-info",
+                                            )
+                                        ]
+                                    ),
+                                    dbc.CardBody(
+                                        [
+                                            dbc.Label(
+                                                "Select Cases to Compare",
+                                                className="text-warning",
+                                            ),
+                                            dcc.Dropdown(
+                                                id="case-selector",
+                                                options=[],
+                                                value=[],
+                                                multi=True,
+                                                placeholder="Select cases... (all selected by default)",
+                                                className="mb-3 darkly-dropdown",
+                                            ),
+                                            dbc.ButtonGroup(
+                                                [
+                                                    dbc.Button(
+                                                        "Select All",
+                                                        id="select-all-btn",
+                                                        color="info",
+                                                        size="sm",
                                                     ),
-                                                    width=10,
-                                                ),
-                                                dbc.Col(
                                                     dbc.Button(
-                                                        html.I(
-                                                            className="fas fa-times"
-                                                        ),
-                                                        id="clear-dates-button",
-                                                        color="danger",
-                                                        className="mb-3",
-                                                        n_clicks=0,
+                                                        "Clear All",
+                                                        id="clear-all-btn",
+                                                        color="secondary",
+                                                        size="sm",
                                                     ),
-                                                    width=2,
-                                                    className="d-flex align-items-left",
-                                                ),
-                                            ],
-                                            className="g-2",  # gutter spacing
-                                        ),
-                                        html.Hr(),
-                                        # Add New Case Button
-                                        dbc.Button(
-                                            [
-                                                html.I(className="fas fa-plus me-2"),
-                                                "Add New Case",
-                                            ],
-                                            id="add-case-btn",
-                                            color="success",
-                                            className="w-100 mb-3",
-                                        ),
-                                    ],
-                                    className="p-3",
-                                ),
-                            ],
-                            className="mb-4",
-                        )
-                    ],
-                    width=3,
-                ),
-                # Summary Cards
-                dbc.Col(
-                    [
-                        dbc.Row(
-                            [
-                                dbc.Col(
-                                    [
-                                        dbc.Card(
-                                            [
-                                                dbc.CardBody(
-                                                    [
-                                                        html.H6(
-                                                            "Best NOx Performance",
-                                                            className="text-warning",
-                                                        ),
-                                                        html.H3(
-                                                            id="best-nox-value",
-                                                            children="--",
-                                                            className="text-success mb-1",
-                                                        ),
-                                                        html.P(
-                                                            id="best-nox-case",
-                                                            children="No data",
-                                                            className="text-muted mb-0 small",
-                                                        ),
-                                                    ]
-                                                )
-                                            ],
-                                            className="bg-dark text-center shadow",
-                                        )
-                                    ],
-                                    width=3,
-                                ),
-                                dbc.Col(
-                                    [
-                                        dbc.Card(
-                                            [
-                                                dbc.CardBody(
-                                                    [
-                                                        html.H6(
-                                                            "Best Efficiency",
-                                                            className="text-warning",
-                                                        ),
-                                                        html.H3(
-                                                            id="best-efficiency-value",
-                                                            children="--",
-                                                            className="text-info mb-1",
-                                                        ),
-                                                        html.P(
-                                                            id="best-efficiency-case",
-                                                            children="No data",
-                                                            className="text-muted mb-0 small",
-                                                        ),
-                                                    ]
-                                                )
-                                            ],
-                                            className="bg-dark text-center shadow",
-                                        )
-                                    ],
-                                    width=3,
-                                ),
-                                dbc.Col(
-                                    [
-                                        dbc.Card(
-                                            [
-                                                dbc.CardBody(
-                                                    [
-                                                        html.H6(
-                                                            "Lowest Adiabatic Flame Temperature",
-                                                            className="text-warning",
-                                                        ),
-                                                        html.H3(
-                                                            id="best-temp-value",
-                                                            children="--",
-                                                            className="text-info mb-1",
-                                                        ),
-                                                        html.P(
-                                                            id="best-temp-case",
-                                                            children="No data",
-                                                            className="text-muted mb-0 small",
-                                                        ),
-                                                    ]
-                                                )
-                                            ],
-                                            className="bg-dark text-center shadow",
-                                        )
-                                    ],
-                                    width=3,
-                                ),
-                                dbc.Col(
-                                    [
-                                        dbc.Card(
-                                            [
-                                                dbc.CardBody(
-                                                    [
-                                                        html.H6(
-                                                            "Total Cases",
-                                                            className="text-warning",
-                                                        ),
-                                                        html.H3(
-                                                            id="total-cases",
-                                                            children="0",
-                                                            className="text-secondary mb-1",
-                                                        ),
-                                                        html.P(
-                                                            "Completed",
-                                                            className="text-muted mb-0 small",
-                                                        ),
-                                                    ]
-                                                )
-                                            ],
-                                            className="bg-dark text-center shadow",
-                                        )
-                                    ],
-                                    width=3,
-                                ),
-                            ],
-                            className="mb-4",
-                        )
-                    ],
-                    width=9,
-                ),
-            ]
-        ),
-        # Main Visualization Area
-        dbc.Row(
-            [
-                # Graph 1: Primary Emissions Comparison
-                dbc.Col(
-                    [
-                        dbc.Card(
-                            [
-                                dbc.CardHeader(
-                                    [
-                                        html.H5(
-                                            [
-                                                html.I(
-                                                    className="fas fa-chart-bar me-2"
-                                                ),
-                                                "Emissions Comparison",
-                                            ],
-                                            className="mb-0 text-info",
-                                        )
-                                    ]
-                                ),
-                                dbc.CardBody(
-                                    [
-                                        dcc.Loading(
-                                            id="loading-emissions",
-                                            type="circle",
-                                            color="#00D9FF",
-                                            children=[
-                                                dcc.Graph(
-                                                    id="emissions-comparison-plot",
-                                                )
-                                            ],
-                                        )
-                                    ]
-                                ),
-                            ],
-                            className="shadow-lg mb-4",
-                        )
-                    ],
-                    width=6,
-                ),
-                # Graph 2: Temperature Distribution
-                dbc.Col(
-                    [
-                        dbc.Card(
-                            [
-                                dbc.CardHeader(
-                                    [
-                                        html.H5(
-                                            [
-                                                html.I(
-                                                    className="fas fa-thermometer-half me-2"
-                                                ),
-                                                "Temperature Performance",
-                                            ],
-                                            className="mb-0 text-info",
-                                        )
-                                    ]
-                                ),
-                                dbc.CardBody(
-                                    [
-                                        dcc.Loading(
-                                            id="loading-temp",
-                                            type="circle",
-                                            color="#00D9FF",
-                                            children=[
-                                                dcc.Graph(
-                                                    id="temperature-plot",
-                                                )
-                                            ],
-                                        )
-                                    ]
-                                ),
-                            ],
-                            className="shadow-lg mb-4",
-                        )
-                    ],
-                    width=6,
-                ),
-            ]
-        ),
-        dbc.Row(
-            [
-                # Graph 3: Design Parameters Correlation
-                dbc.Col(
-                    [
-                        dbc.Card(
-                            [
-                                dbc.CardHeader(
-                                    [
-                                        html.H5(
-                                            [
-                                                html.I(
-                                                    className="fas fa-project-diagram me-2"
-                                                ),
-                                                "Design Parameters Correlation",
-                                            ],
-                                            className="mb-0 text-info",
-                                        )
-                                    ]
-                                ),
-                                dbc.CardBody(
-                                    [
-                                        dbc.Row(
-                                            [
-                                                dbc.Col(
-                                                    [
-                                                        dbc.Label("X-Axis Parameter"),
-                                                        dbc.Select(
-                                                            id="param-x-selector",
-                                                            options=get_parameter_options(),
-                                                            value=list(
-                                                                SCHEMA[
-                                                                    "design_parameters"
-                                                                ].keys()
-                                                            )[0],
-                                                            className="mb-2",
-                                                        ),
-                                                    ],
-                                                    width=6,
-                                                ),
-                                                dbc.Col(
-                                                    [
-                                                        dbc.Label("Y-Axis Metric"),
-                                                        dbc.Select(
-                                                            id="param-y-selector",
-                                                            options=[
-                                                                {
-                                                                    "label": k.replace(
-                                                                        "_", " "
-                                                                    ).title(),
-                                                                    "value": k,
-                                                                }
-                                                                for k in SCHEMA[
-                                                                    "performance_metrics"
-                                                                ]
+                                                ],
+                                                className="mb-3 w-100",
+                                            ),
+                                            html.Hr(),
+                                            dbc.Label(
+                                                "Time Range Filter",
+                                                className="text-warning",
+                                            ),
+                                            dbc.Row(
+                                                [
+                                                    dbc.Col(
+                                                        dbc.InputGroup(
+                                                            [
+                                                                dbc.Input(
+                                                                    id="start-date",
+                                                                    type="date",
+                                                                ),
+                                                                dbc.InputGroupText(
+                                                                    "→"
+                                                                ),
+                                                                dbc.Input(
+                                                                    id="end-date",
+                                                                    type="date",
+                                                                ),
                                                             ],
-                                                            value=list(
-                                                                SCHEMA[
-                                                                    "performance_metrics"
-                                                                ].keys()
-                                                            )[0],
-                                                            className="mb-2",
+                                                            className="mb-3",
                                                         ),
-                                                    ],
-                                                    width=6,
-                                                ),
-                                            ]
-                                        ),
-                                        dcc.Loading(
-                                            id="loading-correlation",
-                                            type="circle",
-                                            color="#00D9FF",
-                                            children=[
-                                                dcc.Graph(
-                                                    id="correlation-plot",
-                                                )
-                                            ],
-                                        ),
-                                    ]
-                                ),
-                            ],
-                            className="shadow-lg mb-4",
-                        )
-                    ],
-                    width=6,
-                ),
-                # Graph 4: Performance Radar Chart
-                dbc.Col(
-                    [
-                        dbc.Card(
-                            [
-                                dbc.CardHeader(
-                                    [
-                                        html.H5(
-                                            [
-                                                html.I(
-                                                    className="fas fa-chart-radar me-2"
-                                                ),
-                                                "Multi-Parameter Performance",
-                                            ],
-                                            className="mb-0 text-info",
-                                        )
-                                    ]
-                                ),
-                                dbc.CardBody(
-                                    [
-                                        dcc.Loading(
-                                            id="loading-radar",
-                                            type="circle",
-                                            color="#00D9FF",
-                                            children=[
-                                                dcc.Graph(
-                                                    id="radar-plot",
-                                                )
-                                            ],
-                                        )
-                                    ],
-                                ),
-                            ],
-                            className="shadow-lg mb-4",
-                        )
-                    ],
-                    width=6,
-                ),
-            ]
-        ),
-        dbc.Row(
-            [
-                # Graph 5: Time Series Evolution
-                dbc.Col(
-                    [
-                        dbc.Card(
-                            [
-                                dbc.CardHeader(
-                                    [
-                                        html.H5(
-                                            [
-                                                html.I(
-                                                    className="fas fa-chart-line me-2"
-                                                ),
-                                                "Performance Evolution Over Time",
-                                            ],
-                                            className="mb-0 text-info",
-                                        )
-                                    ]
-                                ),
-                                dbc.CardBody(
-                                    [
-                                        dcc.Loading(
-                                            id="loading-timeline",
-                                            type="circle",
-                                            color="#00D9FF",
-                                            children=[
-                                                dcc.Graph(
-                                                    id="timeline-plot",
-                                                )
-                                            ],
-                                        )
-                                    ]
-                                ),
-                            ],
-                            className="shadow-lg mb-4",
-                        )
-                    ],
-                    width=12,
-                )
-            ]
-        ),
-        dbc.Row(
-            [
-                # Graph 6: 3D Parameter Space
-                dbc.Col(
-                    [
-                        dbc.Card(
-                            [
-                                dbc.CardHeader(
-                                    [
-                                        html.H5(
-                                            [
-                                                html.I(className="fas fa-cube me-2"),
-                                                "3D Design Space Exploration",
-                                            ],
-                                            className="mb-0 text-info",
-                                        )
-                                    ]
-                                ),
-                                dbc.CardBody(
-                                    [
-                                        dbc.Row(
-                                            [
-                                                dbc.Col(
-                                                    [
-                                                        dbc.Label("X-Axis"),
-                                                        dbc.Select(
-                                                            id="3d-x-selector",
-                                                            options=get_parameter_options(),
-                                                            value=list(
-                                                                SCHEMA[
-                                                                    "design_parameters"
-                                                                ].keys()
-                                                            )[0],
-                                                        ),
-                                                    ],
-                                                    width=4,
-                                                ),
-                                                dbc.Col(
-                                                    [
-                                                        dbc.Label("Y-Axis"),
-                                                        dbc.Select(
-                                                            id="3d-y-selector",
-                                                            options=get_parameter_options(),
-                                                            value=list(
-                                                                SCHEMA[
-                                                                    "design_parameters"
-                                                                ].keys()
-                                                            )[1]
-                                                            if len(
-                                                                SCHEMA[
-                                                                    "design_parameters"
-                                                                ]
-                                                            )
-                                                            > 1
-                                                            else list(
-                                                                SCHEMA[
-                                                                    "design_parameters"
-                                                                ].keys()
-                                                            )[0],
-                                                        ),
-                                                    ],
-                                                    width=4,
-                                                ),
-                                                dbc.Col(
-                                                    [
-                                                        dbc.Label("Z-Axis"),
-                                                        dbc.Select(
-                                                            id="3d-z-selector",
-                                                            options=get_parameter_options(),
-                                                            value=list(
-                                                                SCHEMA[
-                                                                    "design_parameters"
-                                                                ].keys()
-                                                            )[2]
-                                                            if len(
-                                                                SCHEMA[
-                                                                    "design_parameters"
-                                                                ]
-                                                            )
-                                                            > 2
-                                                            else list(
-                                                                SCHEMA[
-                                                                    "design_parameters"
-                                                                ].keys()
-                                                            )[0],
+                                                        width=10,
+                                                    ),
+                                                    dbc.Col(
+                                                        dbc.Button(
+                                                            html.I(
+                                                                className="fas fa-times"
+                                                            ),
+                                                            id="clear-dates-button",
+                                                            color="danger",
+                                                            className="mb-3",
+                                                            n_clicks=0,
                                                         ),
-                                                    ],
-                                                    width=4,
-                                                ),
-                                            ],
-                                            className="mb-3",
-                                        ),
-                                        dcc.Loading(
-                                            id="loading-3d",
-                                            type="circle",
-                                            color="#00D9FF",
-                                            children=[
-                                                dcc.Graph(
-                                                    id="parameter-3d-plot",
-                                                )
-                                            ],
-                                        ),
-                                    ]
-                                ),
-                            ],
-                            className="shadow-lg mb-4",
-                        )
-                    ],
-                    width=12,
-                )
-            ]
-        ),
-        # Detailed Data Table
-        dbc.Row(
-            [
-                dbc.Col(
-                    [
-                        dbc.Card(
-                            [
-                                dbc.CardHeader(
-                                    [
-                                        html.H5(
-                                            [
-                                                html.I(className="fas fa-table me-2"),
-                                                "Detailed Case Data",
-                                            ],
-                                            className="mb-0 text-info",
-                                        )
-                                    ]
-                                ),
-                                dbc.CardBody([html.Div(id="data-table-container")]),
-                            ],
-                            className="shadow-lg",
-                        )
-                    ],
-                    width=12,
-                )
-            ]
-        ),
-        # Add New Case Modal
-        dbc.Modal(
-            [
-                dbc.ModalHeader("Add New Case"),
-                dbc.ModalBody(
-                    [
-                        dbc.Form(
-                            [
-                                dbc.Row(
-                                    [
-                                        dbc.Col(
-                                            [
-                                                dbc.Label("Case Name"),
-                                                dbc.Input(
-                                                    id="new-case-name",
-                                                    placeholder="e.g., Opt_Design_X",
-                                                ),
-                                            ],
-                                            width=6,
-                                        ),
-                                        dbc.Col(
-                                            [
-                                                dbc.Label("Status"),
-                                                dbc.Select(
-                                                    id="new-case-status",
-                                                    options=[
-                                                        {
-                                                            "label": "Planned",
-                                                            "value": "planned",
-                                                        },
-                                                        {
-                                                            "label": "Running",
-                                                            "value": "running",
-                                                        },
-                                                        {
-                                                            "label": "Completed",
-                                                            "value": "completed",
-                                                        },
-                                                    ],
-                                                    value="planned",
-                                                ),
-                                            ],
-                                            width=6,
-                                        ),
-                                    ],
-                                    className="mb-3",
-                                ),
-                                dbc.Row(
-                                    [
-                                        dbc.Col(
-                                            [
-                                                dbc.Label("Description"),
-                                                dbc.Input(
-                                                    id="new-case-desc",
-                                                    placeholder="Brief description",
-                                                ),
-                                            ],
-                                            width=12,
-                                        ),
-                                    ],
-                                    className="mb-3",
-                                ),
-                                dbc.Row(
-                                    [
-                                        dbc.Col(
-                                            [
-                                                dbc.Label("Timestamp"),
-                                                dcc.DatePickerSingle(
-                                                    id="case-timestamp",
-                                                    date=datetime.today(),
-                                                    display_format="YYYY-MM-DD",
-                                                    placeholder="Select date",
-                                                    className="mb-3 w-100",
-                                                    clearable=True,
-                                                ),
-                                            ],
-                                            width=12,
-                                        ),
-                                    ],
-                                    className="mb-3",
-                                ),
-                                html.H6(
-                                    "Design Parameters",
-                                    className="text-warning mt-3 mb-2",
-                                ),
-                                html.Div(
-                                    id="design-parameters-inputs",
-                                    children=create_parameter_inputs(
-                                        "design_parameters"
+                                                        width=2,
+                                                        className="d-flex align-items-left",
+                                                    ),
+                                                ],
+                                                className="g-2",  # gutter spacing
+                                            ),
+                                            html.Hr(),
+                                            # Add New Case Button
+                                            dbc.Button(
+                                                [
+                                                    html.I(className="fas fa-plus me-2"),
+                                                    "Add New Case",
+                                                ],
+                                                id="add-case-btn",
+                                                color="success",
+                                                className="w-100 mb-3",
+                                            ),
+                                        ],
+                                        className="p-3",
                                     ),
-                                ),
-                                # Performance Metrics Section (hidden by default)
-                                html.Div(
-                                    [
-                                        html.Hr(),
-                                        html.H6(
-                                            "Performance Metrics",
-                                            className="text-warning mt-3 mb-2",
-                                        ),
-                                        html.Div(
-                                            id="performance-metrics-inputs",
-                                            children=create_parameter_inputs(
-                                                "performance_metrics"
+                                ],
+                                className="mb-4",
+                            )
+                        ],
+                        width=3,
+                    ),
+                    # Summary Cards
+                    dbc.Col(
+                        [
+                            dbc.Row(
+                                [_summary_card(*card) for card in SUMMARY_CARDS],
+                                className="mb-4",
+                            )
+                        ],
+                        width=9,
+                    ),
+                ]
+            ),
+            # Main Visualization Area
+            # One shared spinner for the five graphs; content stays visible
+            dcc.Loading(
+                id="loading-graphs",
+                type="circle",
+                color="#00D9FF",
+                overlay_style={"visibility": "visible", "opacity": 0.6},
+                target_components={
+                    "emissions-comparison-plot": "figure",
+                    "temperature-plot": "figure",
+                    "correlation-plot": "figure",
+                    "radar-plot": "figure",
+                    "timeline-plot": "figure",
+                },
+                children=[
+                    dbc.Row(
+                        [
+                            # Graph 1: Primary Emissions Comparison
+                            dbc.Col(
+                                [
+                                    dbc.Card(
+                                        [
+                                            dbc.CardHeader(
+                                                [
+                                                    html.H5(
+                                                        [
+                                                            html.I(
+                                                                className="fas fa-chart-bar me-2"
+                                                            ),
+                                                            "Emissions Comparison",
+                                                        ],
+                                                        className="mb-0 text-info",
+                                                    )
+                                                ]
+                                            ),
+                                            dbc.CardBody(
+                                                [
+                                                    dcc.Graph(
+                                                        id="emissions-comparison-plot",
+                                                        figure=_figure(layout=EMISSIONS_LAYOUT),
+                                                        config=GRAPH_CONFIG,
+                                                    )
+                                                ]
+                                            ),
+                                        ],
+                                        className="shadow-lg mb-4",
+                                    )
+                                ],
+                                width=6,
+                            ),
+                            # Graph 2: Temperature Distribution
+                            dbc.Col(
+                                [
+                                    dbc.Card(
+                                        [
+                                            dbc.CardHeader(
+                                                [
+                                                    html.H5(
+                                                        [
+                                                            html.I(
+                                                                className="fas fa-thermometer-half me-2"
+                                                            ),
+                                                            "Temperature Performance",
+                                                        ],
+                                                        className="mb-0 text-info",
+                                                    )
+                                                ]
+                                            ),
+                                            dbc.CardBody(
+                                                [
+                                                    dcc.Graph(
+                                                        id="temperature-plot",
+                                                        figure=_figure(layout=TEMPERATURE_LAYOUT),
+                                                        config=GRAPH_CONFIG,
+                                                    )
+                                                ]
+                                            ),
+                                        ],
+                                        className="shadow-lg mb-4",
+                                    )
+                                ],
+                                width=6,
+                            ),
+                        ]
+                    ),
+                    dbc.Row(
+                        [
+                            # Graph 3: Design Parameters Correlation
+                            dbc.Col(
+                                [
+                                    dbc.Card(
+                                        [
+                                            dbc.CardHeader(
+                                                [
+                                                    html.H5(
+                                                        [
+                                                            html.I(
+                                                                className="fas fa-project-diagram me-2"
+                                                            ),
+                                                            "Design Parameters Correlation",
+                                                        ],
+                                                        className="mb-0 text-info",
+                                                    )
+                                                ]
+                                            ),
+                                            dbc.CardBody(
+                                                [
+                                                    dbc.Row(
+                                                        [
+                                                            dbc.Col(
+                                                                [
+                                                                    dbc.Label("X-Axis Parameter"),
+                                                                    dbc.Select(
+                                                                        id="param-x-selector",
+                                                                        options=PARAM_OPTIONS,
+                                                                        value=DESIGN_PARAMS[0],
+                                                                        className="mb-2",
+                                                                    ),
+                                                                ],
+                                                                width=6,
+                                                            ),
+                                                            dbc.Col(
+                                                                [
+                                                                    dbc.Label("Y-Axis Metric"),
+                                                                    dbc.Select(
+                                                                        id="param-y-selector",
+                                                                        options=Y_OPTIONS,
+                                                                        value=PERF_METRICS[0],
+                                                                        className="mb-2",
+                                                                    ),
+                                                                ],
+                                                                width=6,
+                                                            ),
+                                                        ]
+                                                    ),
+                                                    dcc.Graph(
+                                                        id="correlation-plot",
+                                                        config=GRAPH_CONFIG,
+                                                    ),
+                                                ]
+                                            ),
+                                        ],
+                                        className="shadow-lg mb-4",
+                                    )
+                                ],
+                                width=6,
+                            ),
+                            # Graph 4: Performance Radar Chart
+                            dbc.Col(
+                                [
+                                    dbc.Card(
+                                        [
+                                            dbc.CardHeader(
+                                                [
+                                                    html.H5(
+                                                        [
+                                                            html.I(
+                                                                className="fas fa-chart-radar me-2"
+                                                            ),
+                                                            "Multi-Parameter Performance",
+                                                        ],
+                                                        className="mb-0 text-info",
+                                                    )
+                                                ]
                                             ),
+                                            dbc.CardBody(
+                                                [
+                                                    dcc.Graph(
+                                                        id="radar-plot",
+                                                        figure=_figure(layout=RADAR_LAYOUT),
+                                                        config=GRAPH_CONFIG,
+                                                    )
+                                                ],
+                                            ),
+                                        ],
+                                        className="shadow-lg mb-4",
+                                    )
+                                ],
+                                width=6,
+                            ),
+                        ]
+                    ),
+                    dbc.Row(
+                        [
+                            # Graph 5: Time Series Evolution
+                            dbc.Col(
+                                [
+                                    dbc.Card(
+                                        [
+                                            dbc.CardHeader(
+                                                [
+                                                    html.H5(
+                                                        [
+                                                            html.I(
+                                                                className="fas fa-chart-line me-2"
+                                                            ),
+                                                            "Performance Evolution Over Time",
+                                                        ],
+                                                        className="mb-0 text-info",
+                                                    )
+                                                ]
+                                            ),
+                                            dbc.CardBody(
+                                                [
+                                                    dcc.Graph(
+                                                        id="timeline-plot",
+                                                        config=GRAPH_CONFIG,
+                                                    )
+                                                ]
+                                            ),
+                                        ],
+                                        className="shadow-lg mb-4",
+                                    )
+                                ],
+                                width=12,
+                            )
+                        ]
+                    ),
+                ],
+            ),
+            dbc.Row(
+                [
+                    # Graph 6: 3D Parameter Space
+                    dbc.Col(
+                        [
+                            dbc.Card(
+                                [
+                                    dbc.CardHeader(
+                                        [
+                                            html.H5(
+                                                [
+                                                    html.I(className="fas fa-cube me-2"),
+                                                    "3D Design Space Exploration",
+                                                ],
+                                                className="mb-0 text-info",
+                                            )
+                                        ]
+                                    ),
+                                    dbc.CardBody(
+                                        [
+                                            dbc.Row(
+                                                [
+                                                    dbc.Col(
+                                                        [
+                                                            dbc.Label("X-Axis"),
+                                                            dbc.Select(
+                                                                id="3d-x-selector",
+                                                                options=PARAM_OPTIONS,
+                                                                value=AXIS_DEFAULTS[0],
+                                                            ),
+                                                        ],
+                                                        width=4,
+                                                    ),
+                                                    dbc.Col(
+                                                        [
+                                                            dbc.Label("Y-Axis"),
+                                                            dbc.Select(
+                                                                id="3d-y-selector",
+                                                                options=PARAM_OPTIONS,
+                                                                value=AXIS_DEFAULTS[1],
+                                                            ),
+                                                        ],
+                                                        width=4,
+                                                    ),
+                                                    dbc.Col(
+                                                        [
+                                                            dbc.Label("Z-Axis"),
+                                                            dbc.Select(
+                                                                id="3d-z-selector",
+                                                                options=PARAM_OPTIONS,
+                                                                value=AXIS_DEFAULTS[2],
+                                                            ),
+                                                        ],
+                                                        width=4,
+                                                    ),
+                                                ],
+                                                className="mb-3",
+                                            ),
+                                            dcc.Loading(
+                                                id="loading-3d",
+                                                type="circle",
+                                                color="#00D9FF",
+                                                children=[
+                                                    dcc.Graph(
+                                                        id="parameter-3d-plot",
+                                                    )
+                                                ],
+                                            ),
+                                        ]
+                                    ),
+                                ],
+                                className="shadow-lg mb-4",
+                            )
+                        ],
+                        width=12,
+                    )
+                ]
+            ),
+            # Detailed Data Table
+            dbc.Row(
+                [
+                    dbc.Col(
+                        [
+                            dbc.Card(
+                                [
+                                    dbc.CardHeader(
+                                        [
+                                            html.H5(
+                                                [
+                                                    html.I(className="fas fa-table me-2"),
+                                                    "Detailed Case Data",
+                                                ],
+                                                className="mb-0 text-info",
+                                            )
+                                        ]
+                                    ),
+                                    dbc.CardBody([_case_table()]),
+                                ],
+                                className="shadow-lg",
+                            )
+                        ],
+                        width=12,
+                    )
+                ]
+            ),
+            # Add New Case Modal
+            dbc.Modal(
+                [
+                    dbc.ModalHeader("Add New Case"),
+                    dbc.ModalBody(
+                        [
+                            dbc.Form(
+                                [
+                                    dbc.Row(
+                                        [
+                                            dbc.Col(
+                                                [
+                                                    dbc.Label("Case Name"),
+                                                    dbc.Input(
+                                                        id="new-case-name",
+                                                        placeholder="e.g., Opt_Design_X",
+                                                    ),
+                                                ],
+                                                width=6,
+                                            ),
+                                            dbc.Col(
+                                                [
+                                                    dbc.Label("Status"),
+                                                    dbc.Select(
+                                                        id="new-case-status",
+                                                        options=[
+                                                            {
+                                                                "label": "Planned",
+                                                                "value": "planned",
+                                                            },
+                                                            {
+                                                                "label": "Running",
+                                                                "value": "running",
+                                                            },
+                                                            {
+                                                                "label": "Completed",
+                                                                "value": "completed",
+                                                            },
+                                                        ],
+                                                        value="planned",
+                                                    ),
+                                                ],
+                                                width=6,
+                                            ),
+                                        ],
+                                        className="mb-3",
+                                    ),
+                                    dbc.Row(
+                                        [
+                                            dbc.Col(
+                                                [
+                                                    dbc.Label("Description"),
+                                                    dbc.Input(
+                                                        id="new-case-desc",
+                                                        placeholder="Brief description",
+                                                    ),
+                                                ],
+                                                width=12,
+                                            ),
+                                        ],
+                                        className="mb-3",
+                                    ),
+                                    dbc.Row(
+                                        [
+                                            dbc.Col(
+                                                [
+                                                    dbc.Label("Timestamp"),
+                                                    dcc.DatePickerSingle(
+                                                        id="case-timestamp",
+                                                        date=datetime.today(),
+                                                        display_format="YYYY-MM-DD",
+                                                        placeholder="Select date",
+                                                        className="mb-3 w-100",
+                                                        clearable=True,
+                                                    ),
+                                                ],
+                                                width=12,
+                                            ),
+                                        ],
+                                        className="mb-3",
+                                    ),
+                                    html.H6(
+                                        "Design Parameters",
+                                        className="text-warning mt-3 mb-2",
+                                    ),
+                                    html.Div(
+                                        id="design-parameters-inputs",
+                                        children=create_parameter_inputs(
+                                            "design_parameters"
                                         ),
-                                    ],
-                                    id="performance-metrics-section",
-                                    style={"display": "none"},
-                                ),
-                            ]
-                        )
-                    ]
-                ),
-                dbc.ModalFooter(
-                    [
-                        dbc.Button("Cancel", id="cancel-btn", color="secondary"),
-                        dbc.Button("Add Case", id="save-case-btn", color="primary"),
-                    ]
-                ),
-            ],
-            id="add-case-modal",
-            is_open=False,
-            size="lg",
-        ),
-        # Hidden div to store refresh trigger
-        html.Div(id="refresh-trigger", children="init", style={"display": "none"}),
-        # Add Font Awesome
-        html.Link(
-            rel="stylesheet",
-            href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css",
-        ),
-    ],
-    fluid=True,
-    id="main-content-container",
-    className="py-3",
-)
+                                    ),
+                                    # Performance Metrics Section (hidden by default)
+                                    html.Div(
+                                        [
+                                            html.Hr(),
+                                            html.H6(
+                                                "Performance Metrics",
+                                                className="text-warning mt-3 mb-2",
+                                            ),
+                                            html.Div(
+                                                id="performance-metrics-inputs",
+                                                children=create_parameter_inputs(
+                                                    "performance_metrics"
+                                                ),
+                                            ),
+                                        ],
+                                        id="performance-metrics-section",
+                                        style={"display": "none"},
+                                    ),
+                                ]
+                            )
+                        ]
+                    ),
+                    dbc.ModalFooter(
+                        [
+                            dbc.Button("Cancel", id="cancel-btn", color="secondary"),
+                            dbc.Button("Add Case", id="save-case-btn", color="primary"),
+                        ]
+                    ),
+                ],
+                id="add-case-modal",
+                is_open=False,
+                size="lg",
+            ),
+            # Hidden div to store refresh trigger
+            html.Div(id="refresh-trigger", children="init", style={"display": "none"}),
+            # Ids of the cases matching the current selection and date range
+            dcc.Store(id="filtered-cache", storage_type="memory"),
+            # Full case selector options (the dropdown only renders a subset)
+            dcc.Store(id="case-options", storage_type="memory"),
+            # Completed cases for the clientside 3D plot
+            dcc.Store(id="cases-store", storage_type="memory"),
+            # Add Font Awesome
+            html.Link(
+                rel="stylesheet",
+                href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css",
+            ),
+        ],
+        fluid=True,
+        id="main-content-container",
+        className="py-3",
+    )
+
+
+layout = html.Div(id="perf-page", children=_build_layout())
 
 
 # Callbacks
@@ -896,69 +1066,67 @@ def register_callbacks(app):
     # Update case selector options
     @app.callback(
         [
+            Output("case-options", "data"),
             Output("case-selector", "options"),
-            Output("date-range-picker", "start_date"),
-            Output("date-range-picker", "end_date"),
+            Output("start-date", "value"),
+            Output("end-date", "value"),
+        ],
+        [
+            Input("refresh-trigger", "data"),
+            Input("case-selector", "search_value"),
         ],
-        [Input("refresh-trigger", "data")],
+        [State("case-options", "data"), State("case-selector", "value")],
     )
-    def update_case_options(_):
+    def update_case_options(_, search_value, all_options, selected_cases):
         try:
-            # Fetch all cases from the database
-            df = db.get_all_cases()
-            if df.empty:
+            # Typing in the selector only narrows the rendered options
+            if ctx.triggered_id == "case-selector" and all_options is not None:
+                options = limit_case_options(all_options, search_value, selected_cases)
+                return no_update, options, no_update, no_update
+
+            # All cases, from the shared snapshot
+            data = cases.get()
+            if not len(data):
                 print("No cases found in the database (case selector)")
-                return [], None, None
+                return [], [], None, None
 
-            # Get unique cases
-            cases_df = df[["case_name", "status", "timestamp"]].drop_duplicates(
-                subset=["case_name"]
-            )
+            # Get unique cases (first row per name, in snapshot order)
+            _, first = np.unique(data.names, return_index=True)
+            first.sort()
 
             options = [
-                {
-                    "label": f"{row['case_name']} ({row['status']})",
-                    "value": row["case_name"],
-                }
-                for _, row in cases_df.iterrows()
+                {"label": f"{name} ({status})", "value": name}
+                for name, status in zip(
+                    data.names[first].tolist(), data.status[first].tolist()
+                )
             ]
 
-            start_date = df["timestamp"].min()
-            end_date = df["timestamp"].max()
+            # Native date inputs only accept plain YYYY-MM-DD values
+            start_date, end_date = data.date_range
 
-            return options, start_date, end_date
+            shown = limit_case_options(options, search_value, selected_cases)
+            return options, shown, start_date, end_date
 
         except Exception as e:
             print(f"Callback error: {str(e)}")
             raise
 
-    # Select/Clear all buttons
-    @app.callback(
+    # Select/Clear all buttons (pure UI, handled in the browser)
+    app.clientside_callback(
+        ClientsideFunction(namespace="cases", function_name="select_clear_all"),
         Output("case-selector", "value"),
         [Input("select-all-btn", "n_clicks"), Input("clear-all-btn", "n_clicks")],
-        [State("case-selector", "options")],
+        [State("case-options", "data")],
     )
-    def select_clear_all(select_clicks, clear_clicks, options):
-        ctx = callback_context
-        if not ctx.triggered:
-            return []
-
-        button_id = ctx.triggered[0]["prop_id"].split(".")[0]
-        if button_id == "select-all-btn" and options:
-            return [opt["value"] for opt in options]
-        return []
-    
-    # Clear date range picker
-    @app.callback(
-        Output("date-range-picker", "start_date", allow_duplicate=True),
-        Output("date-range-picker", "end_date", allow_duplicate=True),
+
+    # Clear date range inputs
+    app.clientside_callback(
+        ClientsideFunction(namespace="cases", function_name="clear_dates"),
+        Output("start-date", "value", allow_duplicate=True),
+        Output("end-date", "value", allow_duplicate=True),
         Input("clear-dates-button", "n_clicks"),
         prevent_initial_call=True,
     )
-    def clear_dates(n_clicks):
-        if n_clicks:
-            return None, None
-        return dash.no_update, dash.no_update
 
     # Update summary cards
     @app.callback(
@@ -971,87 +1139,11 @@ def register_callbacks(app):
             Output("best-temp-case", "children"),
             Output("total-cases", "children"),
         ],
-        [
-            Input("case-selector", "value"),
-            Input("date-range-picker", "start_date"),
-            Input("date-range-picker", "end_date"),
-        ],
+        [Input("start-date", "value"), Input("end-date", "value")],
     )
-    def update_summary_cards(selected_cases, start_date, end_date):
-        df = db.get_all_cases()
-
-        # Filter by date if provided
-        if start_date and end_date:
-            df = df[(df["timestamp"] >= start_date) & (df["timestamp"] <= end_date)]
-
-        # Filter completed cases
-        df_complete = df[df["status"] == "completed"]
-
-        # Dynamic summary based on available metrics
-        best_nox_val = "--"
-        best_nox_case = "No data"
-        best_eff_val = "--"
-        best_eff_case = "No data"
-        best_pattern_val = "--"
-        best_pattern_case = "No data"
-
-        # Check for NOx emissions
-        if "nox_emissions" in df_complete.columns:
-            df_nox = df_complete.dropna(subset=["nox_emissions"])
-            if not df_nox.empty:
-                best_row = df_nox.loc[df_nox["nox_emissions"].idxmin()]
-                best_nox_val = f"{best_row['nox_emissions']:.1f} ppm"
-                best_nox_case = best_row["case_name"]
-
-        # Check for efficiency
-        if "combustion_efficiency" in df_complete.columns:
-            df_eff = df_complete.dropna(subset=["combustion_efficiency"])
-            if not df_eff.empty:
-                best_row = df_eff.loc[df_eff["combustion_efficiency"].idxmax()]
-                best_eff_val = f"{best_row['combustion_efficiency']:.1f}%"
-                best_eff_case = best_row["case_name"]
-
-        # Check for pattern factor
-        if "temperature_max" in df_complete.columns:
-            df_pattern = df_complete.dropna(subset=["temperature_max"])
-            if not df_pattern.empty:
-                best_row = df_pattern.loc[df_pattern["temperature_max"].idxmin()]
-                best_pattern_val = f"{best_row['temperature_max']:.1f} K"
-                best_pattern_case = best_row["case_name"]
-
-        total_complete = len(df_complete)
-
-        # Quick stats
-        stats_content = []
-        if selected_cases:
-            selected_df = df[df["case_name"].isin(selected_cases)]
-            stats_content.append(
-                html.P(f"Selected: {len(selected_cases)}", className="mb-1")
-            )
-            stats_content.append(
-                html.P(
-                    f"Completed: {len(selected_df[selected_df['status'] == 'completed'])}",
-                    className="mb-1",
-                )
-            )
-            stats_content.append(
-                html.P(
-                    f"Running: {len(selected_df[selected_df['status'] == 'running'])}",
-                    className="mb-0",
-                )
-            )
-        else:
-            stats_content.append(html.P("No cases selected", className="text-muted"))
-
-        return (
-            best_nox_val,
-            best_nox_case,
-            best_eff_val,
-            best_eff_case,
-            best_pattern_val,
-            best_pattern_case,
-            str(total_complete),
-        )
+    def update_summary_cards(start_date, end_date):
+        # Snapshots are immutable, so repeated date ranges hit the memo
+        return summary_card_values(cases.get(), start_date, end_date)
 
     # Show/hide performance metrics based on status
     @app.callback(
@@ -1090,40 +1182,36 @@ def register_callbacks(app):
         ]
         +
         # Dynamically add all design parameter states
-        [State(f"new-{param}", "value") for param in SCHEMA["design_parameters"]]
+        [State(f"new-{param}", "value") for param in DESIGN_PARAMS]
         +
         # Dynamically add all performance metric states
-        [State(f"new-{metric}", "value") for metric in SCHEMA["performance_metrics"]],
+        [State(f"new-{metric}", "value") for metric in PERF_METRICS],
     )
     def save_new_case(n_clicks, case_date, name, desc, status, *args):
         if not n_clicks or not name:
             return no_update
 
         # Split args into design parameters and performance metrics
-        design_param_values = args[: len(SCHEMA["design_parameters"])]
-        performance_metric_values = args[len(SCHEMA["design_parameters"]) :]
-
-        # Prepare design parameters
-        design_params = {}
-        for i, (param_name, param_info) in enumerate(
-            SCHEMA["design_parameters"].items()
-        ):
-            value = design_param_values[i]
-            if value is None:
-                value = param_info.get("default", 0)
-            design_params[param_name] = value
+        design_param_values = args[: len(DESIGN_PARAMS)]
+        performance_metric_values = args[len(DESIGN_PARAMS) :]
+
+        # Prepare design parameters, falling back to the schema defaults
+        design_params = {
+            param: default if value is None else value
+            for param, default, value in zip(
+                DESIGN_PARAMS, DESIGN_DEFAULTS, design_param_values
+            )
+        }
 
         # Prepare performance metrics if status is completed
         performance_metrics = None
         if status == "completed":
-            # Check if any performance metric has been provided
-            has_metrics = any(v is not None for v in performance_metric_values)
-            if has_metrics:
-                performance_metrics = {}
-                for i, metric_name in enumerate(SCHEMA["performance_metrics"].keys()):
-                    value = performance_metric_values[i]
-                    if value is not None:
-                        performance_metrics[metric_name] = value
+            # Only the metrics that have been provided (None if there are none)
+            performance_metrics = {
+                metric: value
+                for metric, value in zip(PERF_METRICS, performance_metric_values)
+                if value is not None
+            } or None
 
         # Insert the case
         success = db.insert_case(
@@ -1131,173 +1219,189 @@ def register_callbacks(app):
         )
 
         if success:
+            cases.invalidate()
             return "refresh"
         else:
             return no_update
 
-    # Graph 1: Emissions Comparison (Dynamic)
+    # Filter cases once per selection / date range change
     @app.callback(
-        Output("emissions-comparison-plot", "figure"), [Input("case-selector", "value")]
+        Output("filtered-cache", "data"),
+        [
+            Input("case-selector", "value"),
+            Input("start-date", "value"),
+            Input("end-date", "value"),
+        ],
     )
-    def update_emissions_plot(selected_cases):
-        df = db.get_all_cases()
-        df_complete = df[df["status"] == "completed"]
-
-        # Find emission-related metrics
-        emission_metrics = []
-        for metric in SCHEMA["performance_metrics"]:
-            if "emission" in metric.lower() or metric in [
-                "nox_emissions",
-                "co_emissions",
-            ]:
-                if metric in df_complete.columns:
-                    emission_metrics.append(metric)
-
-        if selected_cases:
-            df_complete = df_complete[df_complete["case_name"].isin(selected_cases)]
-
-        fig = go.Figure()
-
-        if not df_complete.empty and emission_metrics:
-            # Create bars for each emission metric
-            colors = ["#00D9FF", "#FF6B6B", "#4ECDC4", "#FFE66D", "#A06CD5"]
-
-            for i, metric in enumerate(emission_metrics):
-                df_metric = df_complete.dropna(subset=[metric])
-                if not df_metric.empty:
-                    fig.add_trace(
-                        go.Bar(
-                            x=df_metric["case_name"],
-                            y=df_metric[metric],
-                            name=metric.replace("_", " ").title(),
-                            marker_color=colors[i % len(colors)],
-                            marker_line_color="#ffffff",
-                            marker_line_width=1.5,
-                            text=df_metric[metric].round(1),
-                            textposition="outside",
-                            textfont=dict(color="#ffffff"),
-                        )
-                    )
-
-        fig.update_layout(
-            plot_bgcolor="rgba(0,0,0,0)",
-            paper_bgcolor="rgba(0,0,0,0)",
-            font=dict(color="#ffffff"),
-            xaxis=dict(gridcolor="#444444", title="Case Name", tickangle=-45),
-            yaxis=dict(gridcolor="#444444", title="Emissions (ppm)"),
-            barmode="group",
-            hovermode="x unified",
-            legend=dict(
-                bgcolor="rgba(0,0,0,0.5)", bordercolor="#444444", borderwidth=1
-            ),
-        )
-
-        return fig
-
-    # Graph 2: Temperature Performance (Dynamic)
+    def update_filtered_cache(selected_cases, start_date, end_date):
+        data = cases.get()
+        mask = data.mask(selected_cases, start_date, end_date)
+        return {
+            "selected": bool(selected_cases),
+            "ids": data.ids[mask].tolist(),
+            "dates": [start_date, end_date],
+        }
+
+    # Graphs 1-5: one callback, driven by the filtered case ids
     @app.callback(
-        Output("temperature-plot", "figure"), [Input("case-selector", "value")]
+        [
+            Output("emissions-comparison-plot", "figure"),
+            Output("temperature-plot", "figure"),
+            Output("correlation-plot", "figure"),
+            Output("radar-plot", "figure"),
+            Output("timeline-plot", "figure"),
+        ],
+        [
+            Input("filtered-cache", "data"),
+            Input("param-x-selector", "value"),
+            Input("param-y-selector", "value"),
+        ],
     )
-    def update_temperature_plot(selected_cases):
-        df = db.get_all_cases()
-        df_complete = df[df["status"] == "completed"]
+    def update_graphs(filtered, param_x, param_y):
+        if filtered is None:
+            return (no_update,) * 5
 
-        # Find temperature-related metrics
-        temp_metrics = []
-        for metric in SCHEMA["performance_metrics"]:
-            if "temperature" in metric.lower() or "temp" in metric.lower():
-                if metric in df_complete.columns:
-                    temp_metrics.append(metric)
+        data = cases.get()
+        ids = tuple(filtered["ids"])
+        selected_cases = filtered["selected"]
+        start_date, end_date = filtered["dates"]
+        correlation = case_figure(data, build_correlation_plot, ids, param_x, param_y)
 
-        if selected_cases:
-            df_complete = df_complete[df_complete["case_name"].isin(selected_cases)]
+        # Axis selectors only affect the correlation plot
+        if ctx.triggered_id in ("param-x-selector", "param-y-selector"):
+            return no_update, no_update, correlation, no_update, no_update
 
-        fig = go.Figure()
+        # Graphs with a static layout only receive their new traces
+        return (
+            _data_patch(case_figure(data, build_emissions_plot, ids)),
+            _data_patch(case_figure(data, build_temperature_plot, ids)),
+            correlation,
+            _data_patch(
+                case_figure(
+                    data, build_radar_plot, ids, selected_cases, start_date, end_date
+                )
+            ),
+            case_figure(
+                data, build_timeline_plot, ids, selected_cases, start_date, end_date
+            ),
+        )
 
-        if not df_complete.empty and temp_metrics:
-            colors = {
-                "max": "#FF6B6B",
-                "avg": "#4ECDC4",
-                "min": "#00D9FF",
-                "std": "#FFE66D",
-            }
+    # Built figures per selection, dropped when the case snapshot is reloaded
+    @cases.memoize
+    def case_figure(data, builder, ids, *args):
+        """Build a figure dict for the given case ids"""
+        mask = np.isin(data.ids, ids)
+        return builder(data, mask, *args)
 
-            for metric in temp_metrics:
-                df_metric = df_complete.dropna(subset=[metric])
-                if not df_metric.empty:
-                    # Determine color based on metric name
-                    color = "#00D9FF"  # default
-                    for key, col in colors.items():
-                        if key in metric:
-                            color = col
-                            break
-
-                    fig.add_trace(
-                        go.Scatter(
-                            x=df_metric["case_name"],
-                            y=df_metric[metric],
-                            name=metric.replace("_", " ").title(),
-                            mode="lines+markers",
-                            line=dict(color=color, width=3),
-                            marker=dict(
-                                size=10,
-                                color=color,
-                                line=dict(width=2, color="#ffffff"),
-                            ),
-                        )
+    # Graph 1: Emissions Comparison (Dynamic)
+    def build_emissions_plot(data, mask):
+        # Emission-related metrics present in the case arrays
+        emission_metrics = [m for m in EMISSION_METRICS if m in data.arrays]
+
+        # Nothing to plot without matching cases or emission metrics
+        if not emission_metrics or not mask.any():
+            return _figure(layout=EMISSIONS_LAYOUT)
+
+        # Create bars for each emission metric
+        traces = []
+
+        for i, metric in enumerate(emission_metrics):
+            values = data.arrays[metric]
+            metric_mask = mask & ~np.isnan(values)
+            if metric_mask.any():
+                bar = dict(
+                    type="bar",
+                    x=data.names[metric_mask].tolist(),
+                    y=_typed_array(values[metric_mask]),
+                    name=TITLE[metric],
+                    marker=dict(
+                        color=RADAR_COLORS[i % len(RADAR_COLORS)],
+                        line=dict(color="#ffffff", width=1.5),
+                    ),
+                )
+                # Bars have no WebGL type; skip the value labels instead
+                if metric_mask.sum() < WEBGL_MIN_POINTS:
+                    bar.update(
+                        text=values[metric_mask].round(1),
+                        textposition="outside",
+                        textfont=dict(color="#ffffff"),
                     )
+                traces.append(bar)
 
-        fig.update_layout(
-            plot_bgcolor="rgba(0,0,0,0)",
-            paper_bgcolor="rgba(0,0,0,0)",
-            font=dict(color="#ffffff"),
-            xaxis=dict(gridcolor="#444444", title="Case Name", tickangle=-45),
-            yaxis=dict(gridcolor="#444444", title="Temperature (K)"),
-            hovermode="x unified",
-            legend=dict(
-                bgcolor="rgba(0,0,0,0.5)", bordercolor="#444444", borderwidth=1
-            ),
-        )
+        return _figure(traces, EMISSIONS_LAYOUT)
 
-        return fig
+    # Graph 2: Temperature Performance (Dynamic)
+    def build_temperature_plot(data, mask):
+        # Temperature-related metrics present in the case arrays
+        temp_metrics = [m for m in TEMP_METRICS if m in data.arrays]
+
+        # Nothing to plot without matching cases or temperature metrics
+        if not temp_metrics or not mask.any():
+            return _figure(layout=TEMPERATURE_LAYOUT)
+
+        traces = []
+        colors = {
+            "max": "#FF6B6B",
+            "avg": "#4ECDC4",
+            "min": "#00D9FF",
+            "std": "#FFE66D",
+        }
+
+        for metric in temp_metrics:
+            values = data.arrays[metric]
+            metric_mask = mask & ~np.isnan(values)
+            if metric_mask.any():
+                # Determine color based on metric name
+                color = "#00D9FF"  # default
+                for key, col in colors.items():
+                    if key in metric:
+                        color = col
+                        break
 
-    # Graph 3: Design Parameters Correlation (Dynamic)
-    @app.callback(
-        Output("correlation-plot", "figure"),
-        [
-            Input("case-selector", "value"),
-            Input("param-x-selector", "value"),
-            Input("param-y-selector", "value"),
-        ],
-    )
-    def update_correlation_plot(selected_cases, param_x, param_y):
-        df = db.get_all_cases()
-        df_complete = df[df["status"] == "completed"]
+                n_points = metric_mask.sum()
+                traces.append(
+                    dict(
+                        type=(
+                            "scattergl" if n_points >= WEBGL_MIN_POINTS else "scatter"
+                        ),
+                        x=data.names[metric_mask].tolist(),
+                        y=_typed_array(values[metric_mask]),
+                        name=TITLE[metric],
+                        mode="lines+markers",
+                        line=dict(color=color, width=3),
+                        marker=dict(
+                            size=10,
+                            color=color,
+                            line=dict(width=2, color="#ffffff"),
+                        ),
+                    )
+                )
 
-        # Ensure both parameters exist in the dataframe
-        if param_x not in df_complete.columns or param_y not in df_complete.columns:
-            return go.Figure()
+        return _figure(traces, TEMPERATURE_LAYOUT)
 
-        df_complete = df_complete.dropna(subset=[param_x, param_y])
+    # Graph 3: Design Parameters Correlation (Dynamic)
+    def build_correlation_plot(data, mask, param_x, param_y):
+        # Ensure both parameters exist in the case arrays
+        if param_x not in data.arrays or param_y not in data.arrays:
+            return _figure()
 
-        if selected_cases:
-            df_plot = df_complete[df_complete["case_name"].isin(selected_cases)]
-        else:
-            df_plot = df_complete
+        mask = mask & ~np.isnan(data.arrays[param_x]) & ~np.isnan(data.arrays[param_y])
+        x_values = data.arrays[param_x][mask]
+        y_values = data.arrays[param_y][mask]
 
-        fig = go.Figure()
+        traces = []
 
-        if not df_plot.empty:
+        if mask.any():
             # Find a suitable color metric (prefer efficiency if available)
             color_metric = None
-            if "combustion_efficiency" in df_plot.columns:
+            if "combustion_efficiency" in data.arrays:
                 color_metric = "combustion_efficiency"
-            elif "mixing_quality" in df_plot.columns:
+            elif "mixing_quality" in data.arrays:
                 color_metric = "mixing_quality"
             else:
                 # Use the first available performance metric
-                for metric in SCHEMA["performance_metrics"]:
-                    if metric in df_plot.columns and metric != param_y:
+                for metric in PERF_METRICS:
+                    if metric in data.arrays and metric != param_y:
                         color_metric = metric
                         break
 
@@ -1308,11 +1412,14 @@ def register_callbacks(app):
             }
 
             if color_metric:
-                marker_config["color"] = df_plot[color_metric]
+                # Colour values only drive the colour scale; float32 is enough
+                marker_config["color"] = _typed_array(
+                    data.arrays[color_metric][mask].astype(np.float32)
+                )
                 marker_config["colorscale"] = "Viridis"
                 marker_config["showscale"] = True
                 marker_config["colorbar"] = dict(
-                    title=color_metric.replace("_", " ").title(),
+                    title=dict(text=TITLE[color_metric]),
                     bgcolor="rgba(0,0,0,0.5)",
                     bordercolor="#444444",
                     borderwidth=1,
@@ -1321,36 +1428,36 @@ def register_callbacks(app):
             else:
                 marker_config["color"] = "#00D9FF"
 
-            fig.add_trace(
-                go.Scatter(
-                    x=df_plot[param_x],
-                    y=df_plot[param_y],
+            traces.append(
+                dict(
+                    type="scattergl",
+                    x=_typed_array(x_values),
+                    y=_typed_array(y_values),
                     mode="markers+text",
                     marker=marker_config,
-                    text=df_plot["case_name"],
+                    text=data.names[mask].tolist(),
                     textposition="top center",
                     textfont=dict(size=10, color="#ffffff"),
                     hovertemplate=(
                         "<b>%{text}</b><br>"
-                        + f"{param_x.replace('_', ' ').title()}: %{{x:.2f}}<br>"
-                        + f"{param_y.replace('_', ' ').title()}: %{{y:.2f}}<br>"
+                        + f"{TITLE[param_x]}: %{{x:.2f}}<br>"
+                        + f"{TITLE[param_y]}: %{{y:.2f}}<br>"
                         + "<extra></extra>"
                     ),
                 )
             )
 
             # Add trend line
-            if len(df_plot) > 2:
-                z = np.polyfit(df_plot[param_x], df_plot[param_y], 1)
-                p = np.poly1d(z)
-                x_trend = np.linspace(
-                    df_plot[param_x].min(), df_plot[param_x].max(), 100
-                )
-
-                fig.add_trace(
-                    go.Scatter(
-                        x=x_trend,
-                        y=p(x_trend),
+            if len(x_values) > 2:
+                slope, intercept = np.polyfit(x_values, y_values, 1)
+                # A straight line only needs its two end points
+                x_trend = np.array([x_values.min(), x_values.max()])
+
+                traces.append(
+                    dict(
+                        type="scattergl",
+                        x=_typed_array(x_trend),
+                        y=_typed_array(slope * x_trend + intercept),
                         mode="lines",
                         line=dict(color="#FF6B6B", width=2, dash="dash"),
                         name="Trend",
@@ -1358,154 +1465,85 @@ def register_callbacks(app):
                     )
                 )
 
-        # Get labels with units
-        x_label = param_x.replace("_", " ").title()
-        y_label = param_y.replace("_", " ").title()
-
-        if param_x in SCHEMA["design_parameters"]:
-            unit = SCHEMA["design_parameters"][param_x].get("unit", "")
-            if unit and unit != "-":
-                x_label += f" ({unit})"
-
-        if param_y in SCHEMA["performance_metrics"]:
-            unit = SCHEMA["performance_metrics"][param_y].get("unit", "")
-            if unit and unit != "-":
-                y_label += f" ({unit})"
-
-        fig.update_layout(
+        layout = dict(
             plot_bgcolor="rgba(0,0,0,0)",
             paper_bgcolor="rgba(0,0,0,0)",
             font=dict(color="#ffffff"),
-            xaxis=dict(gridcolor="#444444", title=x_label),
-            yaxis=dict(gridcolor="#444444", title=y_label),
+            xaxis=dict(gridcolor="#444444", title=dict(text=LABEL[param_x])),
+            yaxis=dict(gridcolor="#444444", title=dict(text=LABEL[param_y])),
             showlegend=False,
             autosize = True
         )
 
-        return fig
+        return _figure(traces, layout)
 
     # Graph 4: Performance Radar Chart (Dynamic)
-    @app.callback(Output("radar-plot", "figure"), [Input("case-selector", "value")])
-    def update_radar_plot(selected_cases):
-        
-        lower_is_better_metrics = [
-            "nox_emissions",
-            "co_emissions",
-            "pattern_factor",
-        ]
-        
-        df = db.get_all_cases()
-        df_complete = df[df["status"] == "completed"]
-
-        # Get radar metrics dynamically
-        metrics, metric_labels = get_radar_metrics()
-
-        # Filter out metrics that don't exist in the dataframe
+    def build_radar_plot(data, mask, selected_cases, start_date, end_date):
+        # Filter out metrics that don't exist in the case arrays
         available_metrics = []
         available_labels = []
-        for metric, label in zip(metrics, metric_labels):
-            if metric in df_complete.columns:
+        for metric, label in zip(RADAR_METRICS, RADAR_LABELS):
+            if metric in data.arrays:
                 available_metrics.append(metric)
                 available_labels.append(label)
 
         if not available_metrics:
-            return go.Figure()
-
-        if not selected_cases or len(selected_cases) == 0:
-            # Show best performing cases if none selected
-            if "nox_emissions" in df_complete.columns:
-                df_nox = df_complete.dropna(subset=["nox_emissions"])
-                if not df_nox.empty:
-                    best_cases = df_nox.nsmallest(3, "nox_emissions")[
-                        "case_name"
-                    ].tolist()
-                    df_plot = df_complete[df_complete["case_name"].isin(best_cases)]
-                else:
-                    df_plot = df_complete.head(3)
-            else:
-                df_plot = df_complete.head(3)
+            return _figure()
+
+        if not selected_cases:
+            # Show best performing cases in the date range if none selected
+            plot_mask = mask & (np.cumsum(mask) <= 3)
+            if "nox_emissions" in data.arrays:
+                best = lowest_cases(data, "nox_emissions", start_date, end_date)
+                if best:
+                    plot_mask = mask & data.name_mask(best)
         else:
-            df_plot = df_complete[
-                df_complete["case_name"].isin(selected_cases)
-            ]  # Limit to 5 add [:5]
-
-        fig = go.Figure()
-
-        if not df_plot.empty:
-            colors = ["#00D9FF", "#FF6B6B", "#4ECDC4", "#FFE66D", "#A06CD5"]
-
-            for idx, (_, row) in enumerate(df_plot.iterrows()):
-                values = []
-                for metric in available_metrics:
-                    if pd.notna(row.get(metric, None)):
-                        # Check if metric values exist in the complete dataset for normalization
-                        metric_values = df_complete[metric].dropna()
-                        if (
-                            len(metric_values) > 0
-                            and metric_values.max() != metric_values.min()
-                        ):
-                            if metric in lower_is_better_metrics:
-                                # Lower is better - invert normalization
-                                normalized = 1 - (row[metric] - metric_values.min()) / (
-                                    metric_values.max() - metric_values.min()
-                                )
-                            else:
-                                # Higher is better
-                                normalized = (row[metric] - metric_values.min()) / (
-                                    metric_values.max() - metric_values.min()
-                                )
-                        else:
-                            normalized = 0.5  # Default if no variation
-                    else:
-                        normalized = 0
-                    values.append(normalized)
-
-                if values:  # Only plot if we have data
-                    fig.add_trace(
-                        go.Scatterpolar(
-                            r=values + [values[0]],  # Close the polygon
-                            theta=available_labels + [available_labels[0]],
-                            fill="toself",
-                            fillcolor=f"rgba({int(colors[idx % len(colors)][1:3], 16)}, "
-                            f"{int(colors[idx % len(colors)][3:5], 16)}, "
-                            f"{int(colors[idx % len(colors)][5:7], 16)}, 0.2)",
-                            line=dict(color=colors[idx % len(colors)], width=2),
-                            name=row["case_name"],
-                            hovertemplate="%{theta}: %{r:.2f}<extra></extra>",
+            plot_mask = mask
+
+        traces = []
+
+        if plot_mask.any():
+            # Normalise every plotted case against the complete dataset at once
+            metric_values = np.column_stack([data.arrays[m] for m in available_metrics])
+            mins, maxs = np.array(
+                [data.completed_range[m] for m in available_metrics]
+            ).T
+            lower_is_better = [m in LOWER_IS_BETTER for m in available_metrics]
+            # Scores live in [0, 1], so float32 is plenty and halves the payload
+            normalized = normalize_radar(
+                metric_values[plot_mask], mins, maxs, lower_is_better
+            ).astype(np.float32)
+
+            # Close every polygon by repeating its first point
+            closed = np.hstack([normalized, normalized[:, :1]])
+            theta = available_labels + available_labels[:1]
+            for idx, (case_name, values) in enumerate(
+                zip(data.names[plot_mask], closed)
+            ):
+                if len(values):  # Only plot if we have data
+                    traces.append(
+                        dict(
+                            type="scatterpolar",
+                            r=_typed_array(values),
+                            theta=theta,
+                            fillcolor=RADAR_FILLS[idx % len(RADAR_FILLS)],
+                            name=case_name,
                         )
                     )
 
-        fig.update_layout(
-            polar=dict(
-                radialaxis=dict(
-                    visible=True,
-                    range=[0, 1],
-                    gridcolor="#444444",
-                    tickfont=dict(color="#ffffff"),
-                ),
-                angularaxis=dict(gridcolor="#444444", tickfont=dict(color="#ffffff")),
-                bgcolor="rgba(0,0,0,0)",
-            ),
-            plot_bgcolor="rgba(0,0,0,0)",
-            paper_bgcolor="rgba(0,0,0,0)",
-            font=dict(color="#ffffff"),
-            showlegend=True,
-            legend=dict(
-                bgcolor="rgba(0,0,0,0.5)", bordercolor="#444444", borderwidth=1
-            ),
-            autosize=True,
-        )
-
-        return fig
+        return _figure(traces, RADAR_LAYOUT)
 
     # Graph 5: Time Series Evolution (Dynamic)
-    @app.callback(Output("timeline-plot", "figure"), [Input("case-selector", "value")])
-    def update_timeline_plot(selected_cases):
-        df = db.get_all_cases()
-        df_complete = df[df["status"] == "completed"]
-        df_complete = df_complete.sort_values("timestamp")
+    def build_timeline_plot(data, mask, selected_cases, start_date, end_date):
+        # Completed cases in the date range, in chronological order
+        rows = data.completed_rows
+        rows = rows[data.mask(start_date=start_date, end_date=end_date)[rows]]
+        timestamps = data.timestamps[rows]
+        names = data.names[rows]
+        is_selected = mask[rows] if selected_cases else np.zeros(len(rows), bool)
 
-        fig = go.Figure()
+        traces = []
+        annotations = []
 
         # Select up to 3 key metrics to plot
         priority_metrics = []
@@ -1520,28 +1558,38 @@ def register_callbacks(app):
         ]
 
         for metric_name, display_name, color, scale in metric_priorities:
-            if metric_name in df_complete.columns and len(priority_metrics) < 3:
-                df_metric = df_complete.dropna(subset=[metric_name])
-                if not df_metric.empty:
+            if metric_name in data.arrays and len(priority_metrics) < 3:
+                if not np.isnan(data.arrays[metric_name][rows]).all():
                     priority_metrics.append((metric_name, display_name, color, scale))
 
-        for metric_name, display_name, color, scale in priority_metrics:
-            df_metric = df_complete.dropna(subset=[metric_name])
-            if not df_metric.empty:
-                y_values = df_metric[metric_name].values * scale
+        # Scale all plotted metrics in one column-wise multiply
+        scales = np.array([scale for *_, scale in priority_metrics], np.float32)
+        scaled = np.empty((len(rows), len(priority_metrics)), np.float32)
+        for i, (metric_name, *_) in enumerate(priority_metrics):
+            scaled[:, i] = data.arrays[metric_name][rows]
+        scaled *= scales
+        present = ~np.isnan(scaled)
+
+        for i, (metric_name, display_name, color, scale) in enumerate(
+            priority_metrics
+        ):
+            values = scaled[:, i]
+            has_value = present[:, i]
+            if has_value.any():
+                x_values, y_values = downsample_minmax(
+                    timestamps[has_value], values[has_value]
+                )
 
                 # Add unit to display name
-                if metric_name in SCHEMA["performance_metrics"]:
-                    unit = SCHEMA["performance_metrics"][metric_name].get("unit", "")
-                    if unit and unit != "-":
-                        display_name += f" ({unit})"
-                    if scale != 1.0:
-                        display_name += f" ×{scale}"
-
-                fig.add_trace(
-                    go.Scatter(
-                        x=df_metric["timestamp"],
-                        y=y_values,
+                display_name += UNIT[metric_name]
+                if scale != 1.0:
+                    display_name += f" ×{scale}"
+
+                traces.append(
+                    dict(
+                        type="scattergl",
+                        x=x_values.tolist(),
+                        y=_typed_array(y_values),
                         name=display_name,
                         mode="lines+markers",
                         line=dict(color=color, width=3),
@@ -1553,39 +1601,37 @@ def register_callbacks(app):
                 )
 
                 # Highlight selected cases
-                if selected_cases:
-                    selected_df = df_metric[df_metric["case_name"].isin(selected_cases)]
-                    if not selected_df.empty:
-                        y_selected = selected_df[metric_name].values * scale
-
-                        fig.add_trace(
-                            go.Scatter(
-                                x=selected_df["timestamp"],
-                                y=y_selected,
-                                mode="markers",
-                                marker=dict(
-                                    size=15,
-                                    color=color,
-                                    symbol="star",
-                                    line=dict(width=2, color="#ffffff"),
-                                ),
-                                showlegend=False,
-                                hoverinfo="skip",
-                            )
+                selected_mask = has_value & is_selected
+                if selected_mask.any():
+                    traces.append(
+                        dict(
+                            type="scattergl",
+                            x=timestamps[selected_mask].tolist(),
+                            y=_typed_array(values[selected_mask]),
+                            mode="markers",
+                            marker=dict(
+                                size=15,
+                                color=color,
+                                symbol="star",
+                                line=dict(width=2, color="#ffffff"),
+                            ),
+                            showlegend=False,
+                            hoverinfo="skip",
                         )
+                    )
 
         # Add annotations for selected cases
         if selected_cases and priority_metrics:
-            selected_df = df_complete[df_complete["case_name"].isin(selected_cases)]
             first_metric = priority_metrics[0][0]
             scale = priority_metrics[0][3]
-
-            for _, row in selected_df.iterrows():
-                if pd.notna(row.get(first_metric)):
-                    fig.add_annotation(
-                        x=row["timestamp"],
-                        y=row[first_metric] * scale,
-                        text=row["case_name"],
+            first_values = data.arrays[first_metric][rows] * scale
+
+            for i in np.flatnonzero(is_selected & ~np.isnan(first_values)):
+                annotations.append(
+                    dict(
+                        x=timestamps[i],
+                        y=first_values[i],
+                        text=names[i],
                         showarrow=True,
                         arrowhead=2,
                         arrowcolor="#ffffff",
@@ -1593,198 +1639,115 @@ def register_callbacks(app):
                         bgcolor="rgba(0,0,0,0.7)",
                         bordercolor="#00D9FF",
                     )
+                )
 
-        fig.update_layout(
+        layout = dict(
             plot_bgcolor="rgba(0,0,0,0)",
             paper_bgcolor="rgba(0,0,0,0)",
             font=dict(color="#ffffff"),
-            xaxis=dict(gridcolor="#444444", title="Date", tickformat="%Y-%m-%d"),
-            yaxis=dict(gridcolor="#444444", title="Metric Value (Scaled)"),
+            xaxis=dict(gridcolor="#444444", title=dict(text="Date"), tickformat="%Y-%m-%d"),
+            yaxis=dict(gridcolor="#444444", title=dict(text="Metric Value (Scaled)")),
             hovermode="x unified",
+            annotations=annotations,
             legend=dict(
                 bgcolor="rgba(0,0,0,0.5)", bordercolor="#444444", borderwidth=1
             ),
         )
 
-        return fig
+        return _figure(traces, layout)
 
     # Graph 6: 3D Parameter Space (Dynamic)
+    # Completed cases for the 3D plot, sent once; filtering and figure building
+    # then run in the browser (assets/clientside.js)
     @app.callback(
+        Output("cases-store", "data"), [Input("refresh-trigger", "children")]
+    )
+    def update_cases_store(_):
+        data = cases.get()
+        rows = np.flatnonzero(data.completed)
+        params = [opt["value"] for opt in PARAM_OPTIONS if opt["value"] in data.arrays]
+
+        # Find a suitable color metric
+        color_metric = None
+        if "nox_emissions" in data.arrays:
+            color_metric = "nox_emissions"
+            color_title = "NOx (ppm)"
+        elif "combustion_efficiency" in data.arrays:
+            color_metric = "combustion_efficiency"
+            color_title = "Efficiency (%)"
+        else:
+            # Use first available performance metric
+            for metric in PERF_METRICS:
+                if metric in data.arrays:
+                    color_metric = metric
+                    color_title = LABEL[metric]
+                    break
+
+        color = None
+        if color_metric:
+            color = {
+                "title": color_title,
+                "colorscale": get_colorscale("Turbo"),
+                "values": data.arrays[color_metric][rows].tolist(),
+            }
+
+        return {
+            "template": PLOT_TEMPLATE,
+            "ids": data.ids[rows].tolist(),
+            "names": data.names[rows].tolist(),
+            "columns": {param: data.arrays[param][rows].tolist() for param in params},
+            "titles": {param: TITLE[param] for param in params},
+            "labels": {opt["value"]: opt["label"] for opt in PARAM_OPTIONS},
+            "color": color,
+        }
+
+    app.clientside_callback(
+        ClientsideFunction(namespace="tracking", function_name="parameter_3d"),
         Output("parameter-3d-plot", "figure"),
         [
-            Input("case-selector", "value"),
+            Input("filtered-cache", "data"),
+            Input("cases-store", "data"),
             Input("3d-x-selector", "value"),
             Input("3d-y-selector", "value"),
             Input("3d-z-selector", "value"),
         ],
     )
-    def update_3d_plot(selected_cases, x_param, y_param, z_param):
-        df = db.get_all_cases()
-        df_complete = df[df["status"] == "completed"]
-
-        # Ensure all parameters exist
-        required_cols = [x_param, y_param, z_param]
-        for col in required_cols:
-            if col not in df_complete.columns:
-                return go.Figure()
 
-        df_complete = df_complete.dropna(subset=required_cols)
-
-        if selected_cases and not len(selected_cases) == 0:
-            df_complete = df_complete[df_complete["case_name"].isin(selected_cases)]
-
-        fig = go.Figure()
-
-        if not df_complete.empty:
-            # Find a suitable color metric
-            color_metric = None
-            if "nox_emissions" in df_complete.columns:
-                color_metric = "nox_emissions"
-                color_title = "NOx (ppm)"
-            elif "combustion_efficiency" in df_complete.columns:
-                color_metric = "combustion_efficiency"
-                color_title = "Efficiency (%)"
-            else:
-                # Use first available performance metric
-                for metric in SCHEMA["performance_metrics"]:
-                    if metric in df_complete.columns:
-                        color_metric = metric
-                        color_title = metric.replace("_", " ").title()
-                        unit = SCHEMA["performance_metrics"][metric].get("unit", "")
-                        if unit and unit != "-":
-                            color_title += f" ({unit})"
-                        break
+    # Data table (Dynamic): serves only the requested page, sorted server-side
+    @app.callback(
+        [
+            Output("case-data-table", "data"),
+            Output("case-data-table", "page_count"),
+            Output("case-data-table", "page_current"),
+        ],
+        [
+            Input("case-selector", "value"),
+            Input("case-data-table", "page_current"),
+            Input("case-data-table", "page_size"),
+            Input("case-data-table", "sort_by"),
+        ],
+    )
+    def update_data_table(selected_cases, page_current, page_size, sort_by):
+        data = cases.get()
+        df = data.df
 
-            marker_config = {
-                "size": 7,
-                "line": dict(width=1, color="#ffffff"),
-            }
+        if selected_cases:
+            df = df[data.name_mask(selected_cases)]
 
-            if color_metric:
-                df_color = df_complete.dropna(subset=[color_metric])
-                if not df_color.empty:
-                    marker_config["color"] = df_color[color_metric]
-                    marker_config["colorscale"] = "Turbo"
-                    marker_config["showscale"] = True
-                    marker_config["colorbar"] = dict(
-                        title=color_title,
-                        bgcolor="rgba(0,0,0,0.5)",
-                        bordercolor="#444444",
-                        borderwidth=1,
-                        tickfont=dict(color="#ffffff"),
-                    )
-                    df_complete = df_color
-                else:
-                    marker_config["color"] = "#00D9FF"
-            else:
-                marker_config["color"] = "#00D9FF"
+        # A new selection starts again from the first page
+        if ctx.triggered_id == "case-selector" or not page_current:
+            page_current = 0
 
-            # Create 3D scatter plot
-            fig.add_trace(
-                go.Scatter3d(
-                    x=df_complete[x_param],
-                    y=df_complete[y_param],
-                    z=df_complete[z_param],
-                    mode="markers+text",
-                    marker=marker_config,
-                    text=df_complete["case_name"],
-                    textposition="top center",
-                    textfont=dict(size=10, color="#ffffff"),
-                    hovertemplate=(
-                        "<b>%{text}</b><br>"
-                        + f"{x_param.replace('_', ' ').title()}: %{{x:.2f}}<br>"
-                        + f"{y_param.replace('_', ' ').title()}: %{{y:.2f}}<br>"
-                        + f"{z_param.replace('_', ' ').title()}: %{{z:.2f}}<br>"
-                        + "<extra></extra>"
-                    ),
-                )
+        if sort_by:
+            df = df.sort_values(
+                [s["column_id"] for s in sort_by],
+                ascending=[s["direction"] == "asc" for s in sort_by],
+                kind="stable",
             )
 
-        # Get axis labels with units
-        def get_axis_label(param):
-            label = param.replace("_", " ").title()
-            if param in SCHEMA["design_parameters"]:
-                unit = SCHEMA["design_parameters"][param].get("unit", "")
-                if unit and unit != "-":
-                    label += f" ({unit})"
-            return label
-
-        fig.update_layout(
-            scene=dict(
-                xaxis=dict(
-                    title=get_axis_label(x_param),
-                    backgroundcolor="rgba(0,0,0,0)",
-                    gridcolor="#444444",
-                    showbackground=True,
-                    zerolinecolor="#444444",
-                ),
-                yaxis=dict(
-                    title=get_axis_label(y_param),
-                    backgroundcolor="rgba(0,0,0,0)",
-                    gridcolor="#444444",
-                    showbackground=True,
-                    zerolinecolor="#444444",
-                ),
-                zaxis=dict(
-                    title=get_axis_label(z_param),
-                    backgroundcolor="rgba(0,0,0,0)",
-                    gridcolor="#444444",
-                    showbackground=True,
-                    zerolinecolor="#444444",
-                ),
-                camera=dict(eye=dict(x=2.0, y=2.0, z=2.0)),
-                bgcolor="rgba(0,0,0,0)",
-            ),
-            plot_bgcolor="rgba(0,0,0,0)",
-            paper_bgcolor="rgba(0,0,0,0)",
-            font=dict(color="#ffffff"),
-            margin=dict(l=0, r=0, t=0, b=0),
-            autosize=True
-        )
-
-        return fig
-
-    # Data table (Dynamic)
-    @app.callback(
-        Output("data-table-container", "children"), [Input("case-selector", "value")]
-    )
-    def update_data_table(selected_cases):
-        df = db.get_all_cases()
-
-        if selected_cases:
-            df = df[df["case_name"].isin(selected_cases)]
-
-        if df.empty:
-            return dbc.Alert("No data to display", color="secondary")
-
-        # Select key columns for display dynamically
-        display_cols = ["case_name", "timestamp", "status"]
-
-        # Add key design parameters (first 3-4)
-        design_params = list(SCHEMA["design_parameters"].keys())[:4]
-        for param in design_params:
-            if param in df.columns:
-                display_cols.append(param)
-
-        # Add key performance metrics (first 3-4)
-        perf_metrics = list(SCHEMA["performance_metrics"].keys())[:4]
-        for metric in perf_metrics:
-            if metric in df.columns:
-                display_cols.append(metric)
-
-        # Only include columns that exist in the dataframe
-        display_cols = [col for col in display_cols if col in df.columns]
-
-        df_display = df[display_cols].round(2)
-
-        # Create table
-        table = dbc.Table.from_dataframe(
-            df_display,
-            striped=True,
-            bordered=True,
-            hover=True,
-            responsive=True,
-            className="table-dark",
-        )
+        start = page_current * page_size
+        page = df.iloc[start : start + page_size]
+        display_cols = [col for col in TABLE_COLUMNS if col in df.columns]
 
-        return table
+        page_count = max(1, -(-len(df) // page_size))
+        return page[display_cols].to_dict("records"), page_count, page_current